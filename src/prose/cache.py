@@ -0,0 +1,114 @@
+"""Per-boot cache for values that cannot change until the next restart.
+
+Model identifiers, CPU, installed memory, the running macOS version and SIP
+state are fixed for the lifetime of a boot session, yet collecting them costs
+several ``system_profiler``/``sysctl``/``csrutil`` subprocesses. This module
+persists them under ``~/Library/Caches/prose/<boot-session-uuid>.json`` so
+repeat runs (and TUI refreshes) can skip those commands. The boot session UUID
+rotates on every restart, so a cache file can never outlive the values it holds.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import cast
+
+from prose.constants import Timeouts
+from prose.schema import BootCache, HardwareInvariants, SystemInvariants
+from prose.utils import run, verbose_log
+
+
+CACHE_DIR = Path.home() / "Library" / "Caches" / "prose"
+
+# Keys each stored section must carry; anything else is treated as a cache miss
+_SECTION_KEYS: dict[str, frozenset[str]] = {
+    "system": SystemInvariants.__required_keys__,
+    "hardware": HardwareInvariants.__required_keys__,
+}
+
+_boot_uuid: str | None = None
+_boot_cache: BootCache | None = None
+
+
+def get_boot_session_uuid() -> str | None:
+    """Return the kernel boot session UUID, or None when unavailable.
+
+    Returns:
+        The ``kern.bootsessionuuid`` sysctl value (memoized for the process).
+    """
+    global _boot_uuid
+    if _boot_uuid is None:
+        uuid = run(
+            ["sysctl", "-n", "kern.bootsessionuuid"],
+            timeout=Timeouts.FAST,
+            log_errors=False,
+        ).strip()
+        _boot_uuid = uuid or ""
+    return _boot_uuid or None
+
+
+def _cache_path(boot_uuid: str) -> Path:
+    return CACHE_DIR / f"{boot_uuid}.json"
+
+
+def _valid_sections(data: dict) -> dict:
+    """Keep only sections whose keys match the schema (truncated or edited files)."""
+    valid = {}
+    for section, keys in _SECTION_KEYS.items():
+        value = data.get(section)
+        if isinstance(value, dict) and value.keys() >= keys:
+            valid[section] = value
+        elif value is not None:
+            verbose_log(f"Ignoring malformed boot cache section: {section}")
+    return valid
+
+
+def load_boot_cache() -> BootCache:
+    """Load the invariants cached for the current boot session.
+
+    The returned dict is shared for the whole process, so collectors that
+    fill in a section and call save_boot_cache() never clobber each other.
+
+    Returns:
+        BootCache with whichever sections were already stored (may be empty).
+    """
+    global _boot_cache
+    if _boot_cache is not None:
+        return _boot_cache
+
+    _boot_cache = BootCache()
+    boot_uuid = get_boot_session_uuid()
+    if boot_uuid:
+        try:
+            data = json.loads(_cache_path(boot_uuid).read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                _boot_cache.update(cast(BootCache, _valid_sections(data)))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            verbose_log(f"Ignoring unreadable boot cache: {e}")
+    return _boot_cache
+
+
+def save_boot_cache(data: BootCache) -> None:
+    """Persist invariants for the current boot session.
+
+    Cache files left behind by previous boots are removed. Failures are logged
+    and otherwise ignored; the cache is purely an optimization.
+
+    Args:
+        data: BootCache to store for the current boot session.
+    """
+    boot_uuid = get_boot_session_uuid()
+    if not boot_uuid:
+        return
+    path = _cache_path(boot_uuid)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob("*.json"):
+            if stale != path:
+                stale.unlink()
+        path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        verbose_log(f"Failed to write boot cache: {e}")
@@ -23,6 +23,7 @@ from prose.schema import (
     SystemLogs,
     SystemPreferences,
 )
+from prose.sysctl import sysctl_int
 from prose.utils import verbose_log
 
 
@@ -346,33 +347,20 @@ def collect_system_preferences() -> SystemPreferences:
 
 def collect_kernel_parameters() -> KernelParameters:
     """Collect important kernel parameters via sysctl."""
-    max_files = 0
-    max_processes = 0
-    max_vnodes = 0
 
-    # Max files
-    output = utils.run(["sysctl", "-n", "kern.maxfiles"], log_errors=False)
-    if output:
+    def _read_int(name: str) -> int:
+        value = sysctl_int(name)
+        if value is not None:
+            return value
+        output = utils.run(["sysctl", "-n", name], log_errors=False)
         try:
-            max_files = int(output.strip())
+            return int(output.strip())
         except ValueError:
-            pass
-
-    # Max processes
-    output = utils.run(["sysctl", "-n", "kern.maxproc"], log_errors=False)
-    if output:
-        try:
-            max_processes = int(output.strip())
-        except ValueError:
-            pass
+            return 0
 
-    # Max vnodes
-    output = utils.run(["sysctl", "-n", "kern.maxvnodes"], log_errors=False)
-    if output:
-        try:
-            max_vnodes = int(output.strip())
-        except ValueError:
-            pass
+    max_files = _read_int("kern.maxfiles")
+    max_processes = _read_int("kern.maxproc")
+    max_vnodes = _read_int("kern.maxvnodes")
 
     return {"max_files": max_files, "max_processes": max_processes, "max_vnodes": max_vnodes}
 
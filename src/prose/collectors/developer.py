@@ -36,7 +36,15 @@ from prose.schema import (
     DockerInfo,
     GitConfig,
 )
-from prose.utils import get_version, run, verbose_log, which
+from prose.utils import async_get_versions, get_version, run, verbose_log, which
+
+
+async def _probe_versions(checks: dict[str, list[str]]) -> dict[str, str]:
+    """Probe every installed tool in checks concurrently; others are "Not installed"."""
+    installed = {name: cmd for name, cmd in checks.items() if which(cmd[0])}
+    versions = dict.fromkeys(checks, "Not installed")
+    versions.update(await async_get_versions(installed))
+    return versions
 
 
 def collect_docker_info() -> DockerInfo:
@@ -214,7 +222,7 @@ def collect_browsers() -> list[BrowserInfo]:
     return browsers
 
 
-def collect_languages() -> dict[str, str]:
+async def collect_languages() -> dict[str, str]:
     """Detect installed programming languages and their versions.
 
     Checks for 8 major programming languages commonly used in macOS development.
@@ -245,7 +253,6 @@ def collect_languages() -> dict[str, str]:
             ...
         }
     """
-    languages = {}
     lang_checks = {
         "node": ["node", "--version"],
         "python3": ["python3", "--version"],
@@ -256,12 +263,7 @@ def collect_languages() -> dict[str, str]:
         "php": ["php", "--version"],
         "perl": ["perl", "--version"],
     }
-    for name, cmd in lang_checks.items():
-        if which(name) or (name == "rust" and which("rustc")):
-            languages[name] = get_version(cmd)
-        else:
-            languages[name] = "Not installed"
-    return languages
+    return await _probe_versions(lang_checks)
 
 
 def collect_sdks() -> dict[str, str]:
@@ -308,7 +310,7 @@ def collect_sdks() -> dict[str, str]:
     return sdks
 
 
-def collect_cloud_devops() -> dict[str, str]:
+async def collect_cloud_devops() -> dict[str, str]:
     """Detect installed cloud platform CLIs and DevOps tools.
 
     Checks for command-line interfaces (CLIs) used in cloud development and
@@ -333,7 +335,6 @@ def collect_cloud_devops() -> dict[str, str]:
             "terraform": "Terraform v1.7.0"
         }
     """
-    cloud_devops = {}
     cloud_checks = {
         "aws": ["aws", "--version"],
         "gcloud": ["gcloud", "--version"],
@@ -341,16 +342,10 @@ def collect_cloud_devops() -> dict[str, str]:
         "kubectl": ["kubectl", "version", "--client"],
         "helm": ["helm", "version"],
     }
-    for name, cmd in cloud_checks.items():
-        if which(name):
-            cloud_devops[name] = get_version(cmd)
-        else:
-            cloud_devops[name] = "Not installed"
-    return cloud_devops
+    return await _probe_versions(cloud_checks)
 
 
-def collect_databases() -> dict[str, str]:
-    databases = {}
+async def collect_databases() -> dict[str, str]:
     db_checks = {
         "redis": ["redis-cli", "--version"],
         "mongodb_shell": ["mongosh", "--version"],
@@ -358,12 +353,7 @@ def collect_databases() -> dict[str, str]:
         "postgresql": ["psql", "--version"],
         "sqlite": ["sqlite3", "--version"],
     }
-    for name, cmd in db_checks.items():
-        if which(cmd[0]):
-            databases[name] = get_version(cmd)
-        else:
-            databases[name] = "Not installed"
-    return databases
+    return await _probe_versions(db_checks)
 
 
 def collect_version_managers() -> dict[str, str]:
@@ -598,10 +588,10 @@ async def collect_dev_tools() -> DeveloperToolsInfo:
         terminal_emulators,
         shell_frameworks,
     ) = await asyncio.gather(
-        asyncio.to_thread(collect_languages),
+        collect_languages(),
         asyncio.to_thread(collect_sdks),
-        asyncio.to_thread(collect_cloud_devops),
-        asyncio.to_thread(collect_databases),
+        collect_cloud_devops(),
+        collect_databases(),
         asyncio.to_thread(collect_version_managers),
         asyncio.to_thread(
             lambda: get_version(["git", "--version"]) if which("git") else "Not installed"
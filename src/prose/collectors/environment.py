@@ -5,7 +5,12 @@ import re
 from pathlib import Path
 
 from prose.constants import Timeouts
-from prose.iokit import get_boot_args, get_csr_active_config, read_nvram  # Phase 5
+from prose.iokit import (  # Phase 5
+    get_boot_args,
+    get_csr_active_config,
+    read_nvram,
+    read_nvram_all,
+)
 from prose.schema import (
     ApplicationsInfo,
     BatteryInfo,
@@ -631,11 +636,9 @@ def collect_nvram_variables() -> NVRAMInfo:
             nvram_info["hardware_model"] = hardware_model
             verbose_log(f"HardwareModel: {hardware_model}")
 
-        # Count total NVRAM variables
-        nvram_all = run(["nvram", "-p"], timeout=Timeouts.FAST, log_errors=False)
-        if nvram_all:
-            # Count lines that look like "key\tvalue"
-            count = len([line for line in nvram_all.splitlines() if "\t" in line])
+        # Count total NVRAM variables (reuses the cached nvram -p dump)
+        count = len(read_nvram_all())
+        if count:
             nvram_info["nvram_variables_count"] = count
             verbose_log(f"Total NVRAM variables: {count}")
 
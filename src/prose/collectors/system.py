@@ -6,8 +6,10 @@ import platform
 import plistlib
 import re
 import subprocess
-from typing import cast
+import time
+from typing import Callable, TypeVar, cast
 
+from prose.cache import load_boot_cache, save_boot_cache
 from prose.constants import Timeouts
 from prose.macos_versions import get_macos_version_info
 from prose.schema import (
@@ -17,10 +19,13 @@ from prose.schema import (
     DiskInfo,
     DisplayInfo,
     HardwareInfo,
+    HardwareInvariants,
     MemoryPressure,
     SystemInfo,
+    SystemInvariants,
     TimeMachineInfo,
 )
+from prose.sysctl import get_boot_time, get_load_average, sysctl_int, sysctl_string
 from prose.utils import (
     async_get_json_output,
     async_run_command,
@@ -30,20 +35,87 @@ from prose.utils import (
 )
 
 
-async def _get_uptime_seconds() -> int:
-    """Get system uptime in seconds."""
-    try:
-        import time
-
-        boot_time_output = await async_run_command(["sysctl", "-n", "kern.boottime"])
-        boot_time_output = boot_time_output.strip()
-        # Parse boot time string: { sec = 1770357120, usec = 0 }
-        match = re.search(r"sec = (\d+)", boot_time_output)
-        if match:
-            boot_timestamp = int(match.group(1))
-            return int(time.time()) - boot_timestamp
-    except (OSError, ValueError) as e:
-        verbose_log(f"Failed to get uptime seconds from sysctl: {e}")
+_T = TypeVar("_T")
+
+
+async def _resolved(value: _T) -> _T:
+    """Wrap an already-known value so it can sit in an asyncio.gather() call."""
+    return value
+
+
+# system_profiler data types shared by several collectors. They are fetched in
+# one invocation so the tool's framework start-up cost is paid only once.
+_SYSTEM_PROFILER_TYPES = ("SPHardwareDataType", "SPDisplaysDataType")
+_system_profile_inflight: asyncio.Future[dict | list | None] | None = None
+
+
+async def _get_system_profile(data_type: str) -> list[dict[str, object]]:
+    """Return one system_profiler section from a shared, batched invocation.
+
+    Concurrent callers (e.g. display and GPU collection) await the same
+    subprocess; the result is dropped once it completes so the next
+    collection run sees fresh data.
+
+    Args:
+        data_type: One of _SYSTEM_PROFILER_TYPES, e.g. "SPDisplaysDataType".
+
+    Returns:
+        The list stored under data_type, or an empty list on failure.
+    """
+    global _system_profile_inflight
+    if _system_profile_inflight is None:
+        future = asyncio.ensure_future(
+            async_get_json_output(["system_profiler", "-json", *_SYSTEM_PROFILER_TYPES])
+        )
+        _system_profile_inflight = future
+
+        def _clear(_: object) -> None:
+            global _system_profile_inflight
+            if _system_profile_inflight is future:
+                _system_profile_inflight = None
+
+        future.add_done_callback(_clear)
+
+    data = await asyncio.shield(_system_profile_inflight)
+    if isinstance(data, dict):
+        section = data.get(data_type)
+        if isinstance(section, list):
+            return section
+    return []
+
+
+async def _read_sysctl(name: str, reader: Callable[[str], int | str | None]) -> str:
+    """Read a scalar sysctl as `sysctl -n` prints it, in-process when possible."""
+    value = reader(name)
+    if value is not None:
+        return str(value)
+    return await async_run_command(["sysctl", "-n", name])
+
+
+async def _get_boot_time_raw() -> str:
+    """Read kern.boottime in `sysctl -n` format, in-process when possible."""
+    boot_time = get_boot_time()
+    if boot_time is not None:
+        sec, usec = boot_time
+        return f"{{ sec = {sec}, usec = {usec} }} {time.ctime(sec)}"
+    return await async_run_command(["sysctl", "-n", "kern.boottime"])
+
+
+async def _get_load_average_raw() -> str:
+    """Read vm.loadavg in `sysctl -n` format, in-process when possible."""
+    load = get_load_average()
+    if load is not None:
+        return "{{ {:.2f} {:.2f} {:.2f} }}".format(*load)
+    return await async_run_command(["sysctl", "-n", "vm.loadavg"])
+
+
+def _get_uptime_seconds(boot_time_raw: str) -> int:
+    """Get system uptime in seconds from kern.boottime output."""
+    # Parse boot time string: { sec = 1770357120, usec = 0 }
+    match = re.search(r"sec = (\d+)", boot_time_raw)
+    if match:
+        return int(time.time()) - int(match.group(1))
+    verbose_log("Failed to get uptime seconds from kern.boottime")
     return 0
 
 
@@ -171,7 +243,7 @@ def _humanize_connector_type(raw: str) -> str:
     return _CONNECTOR_TYPE_MAP.get(raw, raw)
 
 
-async def _check_sip_enabled() -> bool:
+async def _check_sip_enabled() -> bool | None:
     """Check SIP status from the first line of csrutil output only.
 
     csrutil status output can contain 'enabled' in sub-field descriptions
@@ -179,10 +251,13 @@ async def _check_sip_enabled() -> bool:
       "System Integrity Protection status: enabled."
       "System Integrity Protection status: disabled."
       "System Integrity Protection status: unknown (Custom Configuration)."
+
+    Returns None when csrutil produced no output (failure or timeout), so the
+    result is not mistaken for a definitive "disabled".
     """
     output = await async_run_command(["csrutil", "status"])
     if not output:
-        return False
+        return None
     first_line = output.splitlines()[0].lower()
     return "enabled" in first_line and "unknown" not in first_line
 
@@ -228,52 +303,71 @@ async def _get_board_id_from_ioreg() -> str | None:
     return None
 
 
+async def _get_system_invariants() -> SystemInvariants:
+    """Collect the SystemInfo fields that are fixed for the current boot."""
+    version_info = get_macos_version_info()
+    sp_hard, sip_enabled = await asyncio.gather(
+        _get_system_profile("SPHardwareDataType"),
+        _check_sip_enabled(),
+    )
+
+    # Parse hardware data
+    model_name, model_id = "Unknown Mac", "Unknown"
+    if sp_hard:
+        info = sp_hard[0]
+        if isinstance(info, dict):
+            model_name = str(info.get("machine_name", "Mac"))
+            model_id = str(info.get("machine_model", "Unknown"))
+
+    return {
+        "macos_version": version_info["version"],
+        "macos_name": f"macOS {version_info['name']}",
+        "model_name": model_name,
+        "model_identifier": model_id,
+        "sip_enabled": sip_enabled,
+    }
+
+
 async def collect_system_info() -> SystemInfo:
     log("Collecting system information...")
 
-    version_info = get_macos_version_info()
-    version = version_info["version"]
-    macos_name = f"macOS {version_info['name']}"
+    boot_cache = load_boot_cache()
+    cached = boot_cache.get("system")
 
     # Run all independent commands concurrently
     results = await asyncio.gather(
-        async_get_json_output(["system_profiler", "SPHardwareDataType", "-json"]),
+        _get_system_invariants() if cached is None else _resolved(cached),
         _get_marketing_name_from_system(),
         _get_board_id_from_ioreg(),
         async_run_command(["uname", "-r"]),
         async_run_command(["uptime"]),
-        _get_uptime_seconds(),
-        async_run_command(["sysctl", "-n", "kern.boottime"]),
-        async_run_command(["sysctl", "-n", "vm.loadavg"]),
-        _check_sip_enabled(),
+        _get_boot_time_raw(),
+        _get_load_average_raw(),
         async_run_command(["spctl", "--status"]),
         async_run_command(["fdesetup", "status"]),
         collect_time_machine_info(),
     )
 
     # Explicit type assignments to help mypy
-    hw_data = cast("dict[str, list[dict[str, str | int | float]]]", results[0])
+    invariants = cast(SystemInvariants, results[0])
     system_marketing_name = cast("str | None", results[1])
     system_board_id = cast("str | None", results[2])
     kernel_raw = cast(str, results[3])
     uptime_raw = cast(str, results[4])
-    uptime_seconds = cast(int, results[5])
-    boot_time_raw = cast(str, results[6])
-    load_avg_raw = cast(str, results[7])
-    sip_enabled = cast(bool, results[8])
-    gatekeeper_raw = cast(str, results[9])
-    filevault_raw = cast(str, results[10])
-    time_machine = cast(TimeMachineInfo, results[11])
-
-    # Parse hardware data
-    model_name, model_id = "Unknown Mac", "Unknown"
-    if hw_data and isinstance(hw_data, dict) and "SPHardwareDataType" in hw_data:
-        sp_hard = hw_data["SPHardwareDataType"]
-        if isinstance(sp_hard, list) and len(sp_hard) > 0:
-            info = sp_hard[0]
-            if isinstance(info, dict):
-                model_name = str(info.get("machine_name", "Mac"))
-                model_id = str(info.get("machine_model", "Unknown"))
+    boot_time_raw = cast(str, results[5])
+    load_avg_raw = cast(str, results[6])
+    gatekeeper_raw = cast(str, results[7])
+    filevault_raw = cast(str, results[8])
+    time_machine = cast(TimeMachineInfo, results[9])
+
+    # Never pin a failed probe for the rest of the boot session
+    if (
+        cached is None
+        and invariants["model_identifier"] != "Unknown"
+        and invariants["sip_enabled"] is not None
+    ):
+        boot_cache["system"] = invariants
+        save_boot_cache(boot_cache)
 
     if system_marketing_name:
         verbose_log(f"Model: {system_marketing_name} (source: system, Board: {system_board_id})")
@@ -286,19 +380,19 @@ async def collect_system_info() -> SystemInfo:
 
     return SystemInfo(
         os="Darwin",
-        macos_version=version,
-        macos_name=macos_name,
-        model_name=model_name,
-        model_identifier=model_id,
+        macos_version=invariants["macos_version"],
+        macos_name=invariants["macos_name"],
+        model_name=invariants["model_name"],
+        model_identifier=invariants["model_identifier"],
         marketing_name=system_marketing_name,
         board_id=system_board_id,
         kernel=kernel,
         architecture=architecture,
         uptime=_parse_uptime(uptime_raw.split("load")[0]),
-        uptime_seconds=uptime_seconds,
+        uptime_seconds=_get_uptime_seconds(boot_time_raw),
         boot_time=_parse_boot_time(boot_time_raw),
         load_average=_parse_load_average(load_avg_raw),
-        sip_enabled=sip_enabled,
+        sip_enabled=bool(invariants["sip_enabled"]),
         gatekeeper_enabled="enabled" in gatekeeper_raw.lower(),
         filevault_enabled="on" in filevault_raw.lower(),
         time_machine=time_machine,
@@ -314,13 +408,13 @@ async def collect_display_info() -> list[DisplayInfo]:
     displays: list[DisplayInfo] = []
 
     # Run both IORegistry and system_profiler concurrently
-    ioreg_output, sp_data = await asyncio.gather(
+    ioreg_output, sp_displays = await asyncio.gather(
         async_run_command(
             ["ioreg", "-l", "-w0", "-r", "-a", "-c", "IODisplayConnect"],
             timeout=Timeouts.FAST,
             log_errors=False,
         ),
-        async_get_json_output(["system_profiler", "SPDisplaysDataType", "-json"]),
+        _get_system_profile("SPDisplaysDataType"),
     )
 
     # First, parse EDID data from IORegistry
@@ -375,85 +469,80 @@ async def collect_display_info() -> list[DisplayInfo]:
 
     # Now process display info from system_profiler
     try:
-        if sp_data and isinstance(sp_data, dict) and "SPDisplaysDataType" in sp_data:
-            sp_displays = sp_data["SPDisplaysDataType"]
-            if isinstance(sp_displays, list):
-                for card in sp_displays:
-                    if isinstance(card, dict):
-                        ndrvs = card.get("spdisplays_ndrvs", [])
-                        if isinstance(ndrvs, list):
-                            for display in ndrvs:
-                                if isinstance(display, dict):
-                                    resolution = str(
-                                        display.get("_spdisplays_resolution", "Unknown")
+        for card in sp_displays:
+            if isinstance(card, dict):
+                ndrvs = card.get("spdisplays_ndrvs", [])
+                if isinstance(ndrvs, list):
+                    for display in ndrvs:
+                        if isinstance(display, dict):
+                            resolution = str(display.get("_spdisplays_resolution", "Unknown"))
+
+                            # Get refresh rate (may be missing for internal displays)
+                            refresh = display.get("spdisplays_refresh_rate")
+                            if refresh:
+                                refresh_str = str(refresh)
+                            else:
+                                # Internal displays often don't report refresh rate
+                                # Check if it's an internal display
+                                conn_type = display.get("spdisplays_connection_type", "")
+                                if "internal" in str(conn_type).lower():
+                                    refresh_str = "60 Hz"  # Default for internal displays
+                                else:
+                                    refresh_str = "Unknown"
+
+                            depth = _humanize_color_depth(
+                                str(display.get("spdisplays_depth", "Unknown"))
+                            )
+
+                            # Try to match with EDID data
+                            edid_info: dict[str, str | None] = {
+                                "edid_manufacturer": None,
+                                "edid_product_code": None,
+                                "edid_serial": None,
+                                "connector_type": None,
+                            }
+
+                            # Try to find matching EDID data
+                            display_name = display.get("_name", "")
+                            for key, data_dict in edid_data_map.items():
+                                if display_name in key or key in display_name:
+                                    mfg = data_dict.get("manufacturer_id")
+                                    edid_info["edid_manufacturer"] = mfg
+                                    prod = data_dict.get("product_code")
+                                    edid_info["edid_product_code"] = prod
+                                    serial = data_dict.get("serial_number")
+                                    edid_info["edid_serial"] = serial
+                                    conn = data_dict.get("connector_type")
+                                    edid_info["connector_type"] = conn
+                                    break
+
+                            # Fallback: detect connector from system_profiler
+                            if not edid_info["connector_type"]:
+                                conn_type = display.get("spdisplays_connection_type", "")
+                                if conn_type:
+                                    edid_info["connector_type"] = _humanize_connector_type(
+                                        str(conn_type)
                                     )
 
-                                    # Get refresh rate (may be missing for internal displays)
-                                    refresh = display.get("spdisplays_refresh_rate")
-                                    if refresh:
-                                        refresh_str = str(refresh)
-                                    else:
-                                        # Internal displays often don't report refresh rate
-                                        # Check if it's an internal display
-                                        conn_type = display.get("spdisplays_connection_type", "")
-                                        if "internal" in str(conn_type).lower():
-                                            refresh_str = "60 Hz"  # Default for internal displays
-                                        else:
-                                            refresh_str = "Unknown"
-
-                                    depth = _humanize_color_depth(
-                                        str(display.get("spdisplays_depth", "Unknown"))
-                                    )
-
-                                    # Try to match with EDID data
-                                    edid_info: dict[str, str | None] = {
-                                        "edid_manufacturer": None,
-                                        "edid_product_code": None,
-                                        "edid_serial": None,
-                                        "connector_type": None,
-                                    }
-
-                                    # Try to find matching EDID data
-                                    display_name = display.get("_name", "")
-                                    for key, data_dict in edid_data_map.items():
-                                        if display_name in key or key in display_name:
-                                            mfg = data_dict.get("manufacturer_id")
-                                            edid_info["edid_manufacturer"] = mfg
-                                            prod = data_dict.get("product_code")
-                                            edid_info["edid_product_code"] = prod
-                                            serial = data_dict.get("serial_number")
-                                            edid_info["edid_serial"] = serial
-                                            conn = data_dict.get("connector_type")
-                                            edid_info["connector_type"] = conn
-                                            break
-
-                                    # Fallback: detect connector from system_profiler
-                                    if not edid_info["connector_type"]:
-                                        conn_type = display.get("spdisplays_connection_type", "")
-                                        if conn_type:
-                                            edid_info["connector_type"] = _humanize_connector_type(
-                                                str(conn_type)
-                                            )
-
-                                    displays.append(
-                                        {
-                                            "resolution": resolution,
-                                            "refresh_rate": refresh_str,
-                                            "color_depth": depth,
-                                            "external_displays": (
-                                                0
-                                                if "internal"
-                                                in str(
-                                                    display.get("spdisplays_connection_type", "")
-                                                ).lower()
-                                                else 1
-                                            ),
-                                            "edid_manufacturer": edid_info["edid_manufacturer"],
-                                            "edid_product_code": edid_info["edid_product_code"],
-                                            "edid_serial": edid_info["edid_serial"],
-                                            "connector_type": edid_info["connector_type"],
-                                        }
-                                    )
+                            displays.append(
+                                {
+                                    "resolution": resolution,
+                                    "refresh_rate": refresh_str,
+                                    "color_depth": depth,
+                                    "external_displays": (
+                                        0
+                                        if "internal"
+                                        in str(
+                                            display.get("spdisplays_connection_type", "")
+                                        ).lower()
+                                        else 1
+                                    ),
+                                    "edid_manufacturer": edid_info["edid_manufacturer"],
+                                    "edid_product_code": edid_info["edid_product_code"],
+                                    "edid_serial": edid_info["edid_serial"],
+                                    "connector_type": edid_info["connector_type"],
+                                }
+                            )
 
         # If no displays found, add a default entry
         if not displays:
@@ -554,11 +643,10 @@ async def collect_hardware_info() -> HardwareInfo:
 
     async def _get_gpu_info():
         try:
-            data = await async_get_json_output(["system_profiler", "SPDisplaysDataType", "-json"])
             gpus = []
-            if data and isinstance(data, dict):
-                for card in data.get("SPDisplaysDataType", []):
-                    model = card.get("sppci_model", "Unknown GPU")
+            for card in await _get_system_profile("SPDisplaysDataType"):
+                if isinstance(card, dict):
+                    model = str(card.get("sppci_model", "Unknown GPU"))
                     vram = card.get("spdisplays_vram_shared") or card.get("spdisplays_vram")
                     if vram:
                         model += f" ({vram})"
@@ -568,22 +656,39 @@ async def collect_hardware_info() -> HardwareInfo:
             verbose_log(f"Failed to collect GPU info: {e}")
             return ["Unknown"]
 
+    async def _get_hardware_invariants() -> HardwareInvariants:
+        mem, cpu, cpu_cores_raw = await asyncio.gather(
+            _read_sysctl("hw.memsize", sysctl_int),
+            _read_sysctl("machdep.cpu.brand_string", sysctl_string),
+            _read_sysctl("hw.ncpu", sysctl_int),
+        )
+        return {
+            "cpu": cpu,
+            "cpu_cores": int(cpu_cores_raw) if cpu_cores_raw else 0,
+            "memory_gb": round(int(mem) / 1024**3, 2) if mem.isdigit() else None,
+        }
+
+    boot_cache = load_boot_cache()
+    cached = boot_cache.get("hardware")
+
     # Run all independent commands concurrently
-    mem, cpu, cpu_cores_raw, gpu_info, thermal, displays, memory_pressure = await asyncio.gather(
-        async_run_command(["sysctl", "-n", "hw.memsize"]),
-        async_run_command(["sysctl", "-n", "machdep.cpu.brand_string"]),
-        async_run_command(["sysctl", "-n", "hw.ncpu"]),
+    invariants, gpu_info, thermal, displays, memory_pressure = await asyncio.gather(
+        _get_hardware_invariants() if cached is None else _resolved(cached),
         _get_gpu_info(),
         async_run_command(["pmset", "-g", "therm"]),
         collect_display_info(),
         collect_memory_pressure(),
     )
 
+    if cached is None and invariants["cpu"] and invariants["memory_gb"] is not None:
+        boot_cache["hardware"] = invariants
+        save_boot_cache(boot_cache)
+
     return {
-        "cpu": cpu,
-        "cpu_cores": int(cpu_cores_raw) if cpu_cores_raw else 0,
+        "cpu": invariants["cpu"],
+        "cpu_cores": invariants["cpu_cores"],
         "gpu": gpu_info,
-        "memory_gb": round(int(mem) / 1024**3, 2) if mem.isdigit() else None,
+        "memory_gb": invariants["memory_gb"],
         "thermal_pressure": thermal.splitlines(),
         "displays": displays,
         "memory_pressure": memory_pressure,
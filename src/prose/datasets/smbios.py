@@ -7,10 +7,13 @@ To update: run `python3 scripts/scrape_smbios_models.py --write`.
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 from typing import TypedDict
 
+from prose.macos_versions import get_all_macos_versions
+
 
 class SMBIOSData(TypedDict):
     """SMBIOS metadata for a Mac model.
@@ -70,21 +73,15 @@ def _parse_version_tuple(version_str: str) -> tuple[int, ...]:
     return tuple(parts)
 
 
+@functools.cache
 def _build_os_version_map() -> dict[str, tuple[int, ...]]:
-    """Build OS name → version tuple map from macos_versions.json."""
-    json_path = (
-        Path(__file__).resolve().parent.parent.parent.parent / "data" / "macos_versions.json"
-    )
-    if not json_path.exists():
-        return {}
-    with open(json_path, encoding="utf-8") as f:
-        data = json.load(f)
+    """Build OS name → version tuple map from macos_versions.json (once per process)."""
     result: dict[str, tuple[int, ...]] = {}
-    for entry in data.get("versions", []):
+    for entry in get_all_macos_versions():
         name = entry.get("name", "")
         version = entry.get("version")
         if name and version is not None:
-            result[name] = _parse_version_tuple(str(version))
+            result[str(name)] = _parse_version_tuple(str(version))
     return result
 
 
@@ -12,7 +12,6 @@ import json
 import os
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
 from typing import cast
 
@@ -268,6 +267,30 @@ async def collect_all() -> SystemReport:
     }
 
 
+# Static prompt fragments, built once at import instead of on every call
+_SYS_ADMIN_ROLE = (
+    "You are an expert macOS system administrator and performance analyst. "
+    "Your task is to analyze the provided system data and provide actionable insights."
+)
+
+_OCLP_RECOMMENDATIONS = """
+**IMPORTANT - OCLP-Specific Recommendations:**
+- DO NOT recommend disabling SIP (required for OCLP root patches)
+- DO NOT recommend removing "unsigned" kexts (OCLP patches are intentional)
+- Consider hardware limitations of unsupported Mac models
+- Wi-Fi/Bluetooth patches may be present and necessary
+- Graphics acceleration patches are critical for performance
+- Some system updates may break patches - advise caution with OS updates
+"""
+
+_STANDARD_CONTEXT = """
+## Standard macOS Configuration
+
+This system is running standard macOS without OpenCore Legacy Patcher.
+Standard security recommendations apply (SIP enabled, signed kexts only, etc.).
+"""
+
+
 def generate_ai_prompt(data: SystemReport) -> str:
     """Generate a system prompt for AI analysis.
 
@@ -287,10 +310,10 @@ def generate_ai_prompt(data: SystemReport) -> str:
     # OpenCore context
     oclp_context = ""
     if is_oclp_user:
-        kexts_str = ", ".join(oclp["loaded_kexts"][:3]) if oclp["loaded_kexts"] else "None"
-        amfi_str = (
-            oclp["amfi_configuration"]["amfi_value"] if oclp["amfi_configuration"] else "Unknown"
-        )
+        loaded_kexts = oclp["loaded_kexts"]
+        amfi_config = oclp["amfi_configuration"]
+        kexts_str = ", ".join(loaded_kexts[:3]) if loaded_kexts else "None"
+        amfi_str = amfi_config["amfi_value"] if amfi_config else "Unknown"
         oclp_context = f"""
 ## OpenCore Legacy Patcher Detected
 
@@ -302,37 +325,19 @@ which enables newer macOS versions on unsupported hardware.
 - Unsupported OS: {"✓ Yes" if oclp["unsupported_os_detected"] else "✗ No"}
 - AMFI Config: {amfi_str}
 - Boot Args: {oclp["boot_args"] or "None"}
-- Loaded Kexts: {len(oclp["loaded_kexts"])} installed ({kexts_str})
+- Loaded Kexts: {len(loaded_kexts)} installed ({kexts_str})
 - Patched Frameworks: {len(oclp["patched_frameworks"])} detected
-
-**IMPORTANT - OCLP-Specific Recommendations:**
-- DO NOT recommend disabling SIP (required for OCLP root patches)
-- DO NOT recommend removing "unsigned" kexts (OCLP patches are intentional)
-- Consider hardware limitations of unsupported Mac models
-- Wi-Fi/Bluetooth patches may be present and necessary
-- Graphics acceleration patches are critical for performance
-- Some system updates may break patches - advise caution with OS updates
-"""
+{_OCLP_RECOMMENDATIONS}"""
     else:
-        oclp_context = """
-## Standard macOS Configuration
-
-This system is running standard macOS without OpenCore Legacy Patcher.
-Standard security recommendations apply (SIP enabled, signed kexts only, etc.).
-"""
-
-    # Generate prompt
-    sys_admin_role = (
-        "You are an expert macOS system administrator and performance analyst. "
-        "Your task is to analyze the provided system data and provide actionable insights."
-    )
+        oclp_context = _STANDARD_CONTEXT
 
-    timestamp = datetime.fromtimestamp(data["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(data["timestamp"]))
 
     # Collection errors section
     errors_section = ""
-    if data.get("collection_errors"):
-        errors_list = "\n".join(f"- {err}" for err in data["collection_errors"])
+    collection_errors = data.get("collection_errors")
+    if collection_errors:
+        errors_list = "\n".join(f"- {err}" for err in collection_errors)
         errors_section = f"""
 ## ⚠️ Collection Warnings
 
@@ -349,7 +354,7 @@ The analysis should account for missing information.
     prompt = f"""# macOS System Analysis Assistant
 Generated: {timestamp}
 
-{sys_admin_role}
+{_SYS_ADMIN_ROLE}
 
 {oclp_context}
 
@@ -496,7 +501,9 @@ async def async_main() -> int:
     report = await collect_all()
 
     try:
-        with open(args.output, "w", encoding="utf-8") as f:
+        # json.dump() already encodes incrementally; a 64 KiB buffer batches
+        # its many small chunks into few write() calls.
+        with open(args.output, "w", encoding="utf-8", buffering=65536) as f:
             json.dump(report, f, indent=2)
         utils.log(f"Report saved to: {os.path.abspath(args.output)}", "success")
     except Exception as e:
@@ -10,7 +10,11 @@ class ProseError(Exception):
 
 
 class CollectorError(ProseError):
-    """Raised when a data collector encounters an error."""
+    """Raised when a data collector encounters an error.
+
+    The message is only formatted in __str__, so raising and swallowing the
+    error (a common "tool not available" path) does no string work.
+    """
 
     def __init__(self, collector_name: str, message: str) -> None:
         """Initialize collector error.
@@ -20,11 +24,18 @@ class CollectorError(ProseError):
             message: Error message describing what went wrong.
         """
         self.collector_name = collector_name
-        super().__init__(f"[{collector_name}] {message}")
+        self.message = message
+        super().__init__(collector_name, message)
+
+    def __str__(self) -> str:
+        return f"[{self.collector_name}] {self.message}"
 
 
 class SystemCommandError(ProseError):
-    """Raised when a system command fails to execute."""
+    """Raised when a system command fails to execute.
+
+    Like CollectorError, the command line is only joined in __str__.
+    """
 
     def __init__(self, command: list[str], error: str) -> None:
         """Initialize system command error.
@@ -34,7 +45,11 @@ class SystemCommandError(ProseError):
             error: Error message from the command.
         """
         self.command = command
-        super().__init__(f"Command failed: {' '.join(command)}\n{error}")
+        self.error = error
+        super().__init__(command, error)
+
+    def __str__(self) -> str:
+        return f"Command failed: {' '.join(self.command)}\n{self.error}"
 
 
 class UnsupportedPlatformError(ProseError):
@@ -3,17 +3,175 @@ IOKit and NVRAM access utilities using ctypes (no external dependencies).
 
 This module provides low-level access to macOS IOKit framework and NVRAM
 using only Python stdlib (ctypes + subprocess), avoiding pyobjc dependency.
+NVRAM is read straight from IODeviceTree:/options, with the ``nvram`` command
+as a fallback.
 """
 
 from __future__ import annotations
 
+import ctypes
+import re
+import sys
+
+from prose.constants import Timeouts
 from prose.schema import AMFIConfig
 from prose.utils import run, verbose_log
 
 
+# Process-wide NVRAM dump (IORegistry read, or `nvram -p` fallback) shared by every read
+_nvram_snapshot: dict[str, str] | None = None
+
+# Frameworks and CoreFoundation constants for the ctypes NVRAM reader
+_IOKIT_PATH = "/System/Library/Frameworks/IOKit.framework/IOKit"
+_CF_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_K_CF_STRING_ENCODING_UTF8 = 0x08000100
+_K_CF_NUMBER_SINT64_TYPE = 4
+
+
+def _format_nvram_data(data: bytes) -> str:
+    """Render NVRAM data bytes the way ``nvram -p`` prints them.
+
+    Printable ASCII other than "%" is kept; every other byte becomes "%xx".
+
+    Example:
+        >>> _format_nvram_data(b"2.4.1\\x00")
+        '2.4.1%00'
+    """
+    return "".join(chr(b) if 0x20 <= b < 0x7F and b != 0x25 else f"%{b:02x}" for b in data)
+
+
+def _format_nvram_number(number: int) -> str:
+    """Render an NVRAM number the way ``nvram -p`` prints it."""
+    number &= 0xFFFFFFFF
+    if number == 0xFFFFFFFF:
+        return "-1"
+    return str(number) if number < 1000 else f"0x{number:x}"
+
+
+def _read_nvram_iokit() -> dict[str, str] | None:
+    """Read all NVRAM variables from IODeviceTree:/options via ctypes.
+
+    This is the same IORegistry entry the ``nvram`` tool reads, without the
+    fork/exec. Returns None when IOKit is unavailable so callers can fall
+    back to the subprocess path.
+    """
+    if sys.platform != "darwin":
+        return None
+
+    try:
+        iokit = ctypes.CDLL(_IOKIT_PATH)
+        cf = ctypes.CDLL(_CF_PATH)
+    except OSError as e:
+        verbose_log(f"IOKit unavailable, falling back to nvram: {e}")
+        return None
+
+    cf_ref = ctypes.c_void_p
+    iokit.IORegistryEntryFromPath.argtypes = [ctypes.c_uint32, ctypes.c_char_p]
+    iokit.IORegistryEntryFromPath.restype = ctypes.c_uint32
+    iokit.IORegistryEntryCreateCFProperties.argtypes = [
+        ctypes.c_uint32,
+        ctypes.POINTER(cf_ref),
+        cf_ref,
+        ctypes.c_uint32,
+    ]
+    iokit.IORegistryEntryCreateCFProperties.restype = ctypes.c_int
+    iokit.IOObjectRelease.argtypes = [ctypes.c_uint32]
+    cf.CFDictionaryGetCount.argtypes = [cf_ref]
+    cf.CFDictionaryGetCount.restype = ctypes.c_long
+    cf.CFDictionaryGetKeysAndValues.argtypes = [cf_ref, ctypes.c_void_p, ctypes.c_void_p]
+    cf.CFGetTypeID.argtypes = [cf_ref]
+    cf.CFGetTypeID.restype = ctypes.c_ulong
+    for type_fn in (
+        "CFStringGetTypeID",
+        "CFDataGetTypeID",
+        "CFBooleanGetTypeID",
+        "CFNumberGetTypeID",
+    ):
+        getattr(cf, type_fn).restype = ctypes.c_ulong
+    cf.CFStringGetLength.argtypes = [cf_ref]
+    cf.CFStringGetLength.restype = ctypes.c_long
+    cf.CFStringGetMaximumSizeForEncoding.argtypes = [ctypes.c_long, ctypes.c_uint32]
+    cf.CFStringGetMaximumSizeForEncoding.restype = ctypes.c_long
+    cf.CFStringGetCString.argtypes = [cf_ref, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+    cf.CFStringGetCString.restype = ctypes.c_bool
+    cf.CFDataGetLength.argtypes = [cf_ref]
+    cf.CFDataGetLength.restype = ctypes.c_long
+    cf.CFDataGetBytePtr.argtypes = [cf_ref]
+    cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+    cf.CFBooleanGetValue.argtypes = [cf_ref]
+    cf.CFBooleanGetValue.restype = ctypes.c_bool
+    cf.CFNumberGetValue.argtypes = [cf_ref, ctypes.c_long, ctypes.c_void_p]
+    cf.CFNumberGetValue.restype = ctypes.c_bool
+    cf.CFRelease.argtypes = [cf_ref]
+
+    def cf_string(ref: int) -> str:
+        size = cf.CFStringGetMaximumSizeForEncoding(
+            cf.CFStringGetLength(ref), _K_CF_STRING_ENCODING_UTF8
+        )
+        buf = ctypes.create_string_buffer(size + 1)
+        if not cf.CFStringGetCString(ref, buf, size + 1, _K_CF_STRING_ENCODING_UTF8):
+            return ""
+        return buf.value.decode("utf-8", errors="replace")
+
+    string_type = cf.CFStringGetTypeID()
+    data_type = cf.CFDataGetTypeID()
+    bool_type = cf.CFBooleanGetTypeID()
+    number_type = cf.CFNumberGetTypeID()
+
+    entry = iokit.IORegistryEntryFromPath(0, b"IODeviceTree:/options")
+    if not entry:
+        return None
+
+    props = cf_ref()
+    try:
+        if iokit.IORegistryEntryCreateCFProperties(entry, ctypes.byref(props), None, 0) != 0:
+            return None
+        if not props.value:
+            return None
+
+        try:
+            count = cf.CFDictionaryGetCount(props)
+            keys = (ctypes.c_void_p * count)()
+            values = (ctypes.c_void_p * count)()
+            cf.CFDictionaryGetKeysAndValues(props, keys, values)
+
+            nvram_dict: dict[str, str] = {}
+            for key_ref, value_ref in zip(keys, values):
+                if not key_ref or not value_ref:
+                    continue
+                type_id = cf.CFGetTypeID(value_ref)
+                if type_id == data_type:
+                    length = cf.CFDataGetLength(value_ref)
+                    ptr = cf.CFDataGetBytePtr(value_ref)
+                    value = _format_nvram_data(ctypes.string_at(ptr, length)) if ptr else ""
+                elif type_id == string_type:
+                    value = cf_string(value_ref)
+                elif type_id == bool_type:
+                    value = "true" if cf.CFBooleanGetValue(value_ref) else "false"
+                elif type_id == number_type:
+                    number = ctypes.c_int64(0)
+                    cf.CFNumberGetValue(value_ref, _K_CF_NUMBER_SINT64_TYPE, ctypes.byref(number))
+                    value = _format_nvram_number(number.value)
+                else:
+                    continue
+                nvram_dict[cf_string(key_ref)] = value.strip()
+            return nvram_dict
+        finally:
+            cf.CFRelease(props)
+    except (OSError, ValueError, ctypes.ArgumentError) as e:
+        verbose_log(f"Failed to read NVRAM from IORegistry: {e}")
+        return None
+    finally:
+        iokit.IOObjectRelease(entry)
+
+
 def read_nvram(variable: str, uuid: str | None = None) -> str | None:
     """
-    Read NVRAM variable using nvram command.
+    Read NVRAM variable.
+
+    Looks the variable up in the cached read_nvram_all() dump, so any number
+    of reads costs one in-process IORegistry read per process (or one
+    ``nvram -p`` invocation when IOKit is unavailable).
 
     Args:
         variable: NVRAM variable name (e.g., "OCLP-Version")
@@ -26,40 +184,22 @@ def read_nvram(variable: str, uuid: str | None = None) -> str | None:
         >>> read_nvram("OCLP-Version", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102")
         '2.4.1-RELEASE'
     """
-    try:
-        # Build variable name with UUID prefix if provided
-        var_name = f"{uuid}:{variable}" if uuid else variable
-
-        # Use nvram command to read variable
-        output = run(["nvram", var_name], log_errors=False)
-
-        if not output or "not found" in output.lower():
-            return None
-
-        # Parse output format: "variable_name	value"
-        if "\t" in output:
-            parts = output.split("\t", 1)
-            if len(parts) == 2:
-                value = parts[1].strip()
-                verbose_log(f"NVRAM {var_name} = {value}")
-                return value
-
-        # Alternative format: "variable_name value" (no tab)
-        if " " in output:
-            parts = output.split(" ", 1)
-            if len(parts) == 2:
-                return parts[1].strip()
-
-        return None
-    except Exception as e:
-        verbose_log(f"Failed to read NVRAM {variable}: {e}")
-        return None
+    # Non-Apple scoped variables are keyed "<uuid>:<name>" (as nvram -p prints them)
+    var_name = f"{uuid}:{variable}" if uuid else variable
+    value = read_nvram_all().get(var_name)
+    if value is not None:
+        verbose_log(f"NVRAM {var_name} = {value}")
+    return value
 
 
 def read_nvram_all() -> dict[str, str]:
     """
     Read all NVRAM variables.
 
+    The dump is taken once per process and shared by every NVRAM getter;
+    call invalidate_nvram_cache() to force a fresh read (the enhanced TUI
+    does so before every refresh).
+
     Returns:
         Dictionary of variable name -> value
 
@@ -68,20 +208,37 @@ def read_nvram_all() -> dict[str, str]:
         >>> nvram.get("boot-args")
         'debug=0x100'
     """
+    global _nvram_snapshot
+    if _nvram_snapshot is not None:
+        return _nvram_snapshot
+
+    iokit_dict = _read_nvram_iokit()
+    if iokit_dict is not None:
+        verbose_log(f"Read {len(iokit_dict)} NVRAM variables from IORegistry")
+        _nvram_snapshot = iokit_dict
+        return iokit_dict
+
+    nvram_dict: dict[str, str] = {}
     try:
-        output = run(["nvram", "-p"], log_errors=False)
-        nvram_dict = {}
+        output = run(["nvram", "-p"], timeout=Timeouts.FAST, log_errors=False)
 
         for line in output.splitlines():
-            if "\t" in line:
-                var, val = line.split("\t", 1)
-                nvram_dict[var.strip()] = val.strip()
+            var, sep, val = line.partition("\t")
+            if sep:
+                nvram_dict[var] = val.strip()
 
         verbose_log(f"Read {len(nvram_dict)} NVRAM variables")
-        return nvram_dict
     except (OSError, ValueError) as e:
         verbose_log(f"Failed to read all NVRAM variables: {e}")
-        return {}
+
+    _nvram_snapshot = nvram_dict
+    return nvram_dict
+
+
+def invalidate_nvram_cache() -> None:
+    """Discard the cached NVRAM dump so the next read runs nvram again."""
+    global _nvram_snapshot
+    _nvram_snapshot = None
 
 
 def get_boot_args() -> str | None:
@@ -94,6 +251,10 @@ def get_csr_active_config() -> str | None:
     return read_nvram("csr-active-config")
 
 
+# First "amfi=<value>" token in a boot-args string
+_AMFI_RE = re.compile(r"(?:^|\s)amfi=(\S+)")
+
+
 def parse_amfi_boot_arg(boot_args: str | None) -> AMFIConfig:
     """
     Parse AMFI (AppleMobileFileIntegrity) boot argument bitmask.
@@ -120,30 +281,30 @@ def parse_amfi_boot_arg(boot_args: str | None) -> AMFIConfig:
         "lv_enforce_third_party": False,
     }
 
-    if not boot_args or "amfi=" not in boot_args:
-        return result
-
     # Extract amfi value (e.g., "amfi=0x80" -> "0x80")
-    for arg in boot_args.split():
-        if arg.startswith("amfi="):
-            amfi_str = arg.split("=", 1)[1]
-            result["amfi_value"] = amfi_str
-
-            try:
-                # Parse hex or decimal value
-                amfi_int = int(amfi_str, 16 if "0x" in amfi_str else 10)
-
-                # Check bitmask flags
-                result["allow_task_for_pid"] = bool(amfi_int & 0x1)
-                result["allow_invalid_signature"] = bool(amfi_int & 0x2)
-                result["lv_enforce_third_party"] = bool(amfi_int & 0x4)
-
-                verbose_log(f"AMFI configuration: {amfi_str} (flags: {amfi_int:08b})")
-            except ValueError:
-                pass
+    match = _AMFI_RE.search(boot_args) if boot_args else None
+    if not match:
+        return result
 
-            break
+    amfi_str = match.group(1)
+    result["amfi_value"] = amfi_str
 
+    try:
+        # Parse hex or decimal value (base 0 honours 0x/0o/0b prefixes)
+        amfi_int = int(amfi_str, 0)
+    except ValueError:
+        try:
+            # Base 0 rejects leading-zero decimals such as "080"
+            amfi_int = int(amfi_str, 10)
+        except ValueError:
+            return result
+
+    # Check bitmask flags
+    result["allow_task_for_pid"] = bool(amfi_int & 0x1)
+    result["allow_invalid_signature"] = bool(amfi_int & 0x2)
+    result["lv_enforce_third_party"] = bool(amfi_int & 0x4)
+
+    verbose_log(f"AMFI configuration: {amfi_str} (flags: {amfi_int:08b})")
     return result
 
 
@@ -175,6 +336,7 @@ __all__ = [
     "get_oclp_nvram_settings",
     "get_oclp_nvram_version",
     "get_secure_boot_model",
+    "invalidate_nvram_cache",
     "parse_amfi_boot_arg",
     "read_nvram",
     "read_nvram_all",
@@ -1,17 +1,21 @@
 """
 macOS version detection and mapping utilities.
 
-Version names and metadata are loaded from data/macos_versions.json at runtime.
+Version names and metadata are loaded from data/macos_versions.json on first use.
 To update: run `python3 scripts/scrape_macos_versions.py --write`.
 """
 
 from __future__ import annotations
 
+import functools
 import json
+import plistlib
 import re
+import sys
 from pathlib import Path
 from typing import TypedDict
 
+from prose.parsers import parse_key_value_block
 from prose.utils import run, verbose_log
 
 
@@ -27,17 +31,94 @@ class MacOSVersion(TypedDict):
     marketing_name: str  # e.g., "macOS Monterey 12.7.6"
 
 
+@functools.cache
 def _load_versions_json() -> dict:
     """Load macOS version data from JSON file."""
     json_path = Path(__file__).resolve().parent.parent.parent / "data" / "macos_versions.json"
-    if not json_path.exists():
+    try:
+        # json.loads() detects UTF-8 bytes itself; no text-mode decoding layer
+        return json.loads(json_path.read_bytes())  # type: ignore[no-any-return]
+    except FileNotFoundError:
         return {"version_names": {}, "versions": []}
-    with open(json_path, encoding="utf-8") as f:
-        return json.load(f)  # type: ignore[no-any-return]
 
 
-_VERSIONS_DATA = _load_versions_json()
-VERSION_NAMES: dict[str, str] = _VERSIONS_DATA.get("version_names", {})
+_SYSTEM_VERSION_PLIST = "/System/Library/CoreServices/SystemVersion.plist"
+
+_MAJOR_MINOR_RE = re.compile(r"(\d+\.\d+)", re.ASCII)
+_LEADING_DIGITS_RE = re.compile(r"\d+", re.ASCII)
+
+# VERSION_NAMES is resolved lazily by the module __getattr__ below, so the
+# JSON file is only read by callers that actually need the name tables.
+VERSION_NAMES: dict[str, str]
+
+
+@functools.cache
+def _version_names() -> dict[str, str]:
+    # Interned so every report shares one object per release name
+    names: dict[str, str] = _load_versions_json().get("version_names", {})
+    return {key: sys.intern(name) for key, name in names.items()}
+
+
+@functools.cache
+def _name_tables() -> tuple[dict[int, str], dict[int, str]]:
+    """Build integer-keyed views of VERSION_NAMES: major for 11+, minor for 10.x."""
+    by_major: dict[int, str] = {}
+    by_10_minor: dict[int, str] = {}
+    for key, name in _version_names().items():
+        major, _, minor = key.partition(".")
+        if not minor:
+            by_major[int(major)] = name
+        elif major == "10":
+            by_10_minor[int(minor)] = name
+    return by_major, by_10_minor
+
+
+@functools.cache
+def _known_names() -> tuple[str, ...]:
+    """Distinct release names, longest first so "High Sierra" wins over "Sierra"."""
+    return tuple(sorted(set(_version_names().values()), key=len, reverse=True))
+
+
+def _find_known_macos_name(text: str) -> str | None:
+    """Return the first known name following a "macOS " marker in text.
+
+    A linear str.find() walk over the markers; far cheaper than running the
+    capitalized-word regex over a whole RTF license file.
+    """
+    names = _known_names()
+    pos = text.find("macOS ")
+    while pos != -1:
+        start = pos + len("macOS ")
+        for name in names:
+            if text.startswith(name, start):
+                return name
+        pos = text.find("macOS ", start)
+    return None
+
+
+def __getattr__(name: str) -> object:
+    """Resolve VERSION_NAMES on first access (PEP 562)."""
+    if name == "VERSION_NAMES":
+        return _version_names()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _sw_vers_all() -> dict[str, str]:
+    """
+    Run sw_vers once and return every field it reports.
+
+    Returns:
+        Mapping such as {"ProductName": "macOS", "ProductVersion": "12.7.6",
+        "BuildVersion": "21H1320"} (empty if sw_vers fails)
+    """
+    return parse_key_value_block(run(["sw_vers"], log_errors=False))
+
+
+def _leading_int(part: str) -> int:
+    """Integer value of the leading digits of part (0 if there are none)."""
+    match = _LEADING_DIGITS_RE.match(part)
+    return int(match.group()) if match else 0
 
 
 def parse_version_string(version: str) -> tuple[int, int, int]:
@@ -55,12 +136,13 @@ def parse_version_string(version: str) -> tuple[int, int, int]:
         (12, 7, 6)
         >>> parse_version_string("10.15.7")
         (10, 15, 7)
+        >>> parse_version_string("")
+        (0, 0, 0)
     """
-    parts = version.split(".")
-    major = int(parts[0]) if len(parts) > 0 else 0
-    minor = int(parts[1]) if len(parts) > 1 else 0
-    patch = int(parts[2]) if len(parts) > 2 else 0
-    return (major, minor, patch)
+    major, _, rest = version.strip().partition(".")
+    minor, _, rest = rest.partition(".")
+    patch = rest.partition(".")[0]
+    return (_leading_int(major), _leading_int(minor), _leading_int(patch))
 
 
 def get_version_name_from_number(version: str) -> str:
@@ -80,22 +162,30 @@ def get_version_name_from_number(version: str) -> str:
         'Catalina'
     """
     major, minor, _ = parse_version_string(version)
+    if major == 0:
+        # Empty version (sw_vers unavailable): same fallback as get_version_name_from_system()
+        return "macOS"
+    name_by_major, name_by_10_minor = _name_tables()
 
     # For macOS 11+, major version is the key
     if major >= 11:
-        return VERSION_NAMES.get(str(major), f"macOS {major}")
+        return name_by_major.get(major, f"macOS {major}")
 
-    # For macOS 10.x, use major.minor as key
-    key = f"{major}.{minor}"
-    return VERSION_NAMES.get(key, f"macOS {major}.{minor}")
+    # For macOS 10.x, the minor version is the key
+    name = name_by_10_minor.get(minor) if major == 10 else None
+    return name or f"macOS {major}.{minor}"
 
 
+@functools.cache
 def get_version_name_from_system() -> str:
     """
     Get macOS version name directly from system.
 
+    The result cannot change while the process runs, so it is computed once
+    and cached.
+
     Tries multiple methods:
-    1. sw_vers -productName (new macOS)
+    1. sw_vers ProductName (new macOS)
     2. Parse SystemVersion.plist
     3. Search license files for marketing name
 
@@ -108,10 +198,10 @@ def get_version_name_from_system() -> str:
     """
     # Method 1: sw_vers (newer macOS versions include name)
     try:
-        product_name = run(["sw_vers", "-productName"], log_errors=False).strip()
-        if product_name and "macOS" in product_name:
+        product_name = _sw_vers_all().get("ProductName", "")
+        if product_name.startswith("macOS"):
             # Extract name after "macOS" (e.g., "macOS Monterey" -> "Monterey")
-            name = product_name.replace("macOS", "").strip()
+            name = product_name.removeprefix("macOS").strip()
             if name:
                 verbose_log(f"Detected macOS name from sw_vers: {name}")
                 return name
@@ -121,17 +211,16 @@ def get_version_name_from_system() -> str:
 
     # Method 2: Parse SystemVersion.plist
     try:
-        plist_path = "/System/Library/CoreServices/SystemVersion.plist"
-        plist_output = run(["defaults", "read", plist_path], log_errors=False)
-        if "ProductUserVisibleVersion" in plist_output:
-            # Extract version name from plist output
-            match = re.search(r'ProductUserVisibleVersion.*=.*"([^"]+)"', plist_output)
-            if match:
-                visible_version = match.group(1)
-                # Parse version number from visible version
-                version_match = re.search(r"(\d+\.\d+)", visible_version)
-                if version_match:
-                    return get_version_name_from_number(version_match.group(1))
+        with open(_SYSTEM_VERSION_PLIST, "rb") as f:
+            plist_data = plistlib.load(f)
+        visible_version = plist_data.get("ProductUserVisibleVersion") or plist_data.get(
+            "ProductVersion"
+        )
+        if isinstance(visible_version, str):
+            # Parse version number from visible version
+            version_match = _MAJOR_MINOR_RE.search(visible_version)
+            if version_match:
+                return get_version_name_from_number(version_match.group(1))
     except (OSError, ValueError, KeyError):
         # Fallback silently if plist parsing fails or key is missing
         pass
@@ -146,13 +235,14 @@ def get_version_name_from_system() -> str:
 
         for license_path in license_paths:
             try:
-                license_content = run(["cat", license_path], log_errors=False, timeout=5)
-                # Search for "macOS <Name>" pattern
-                match = re.search(r"macOS ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)", license_content)
-                if match:
-                    name = match.group(1)
-                    verbose_log(f"Detected macOS name from license: {name}")
-                    return name
+                with open(license_path, "rb") as f:
+                    license_content = f.read().decode("utf-8", "ignore")
+                # Only accept "macOS <Name>" for known release names; license
+                # text also says e.g. "macOS Software License Agreement"
+                found = _find_known_macos_name(license_content)
+                if found:
+                    verbose_log(f"Detected macOS name from license: {found}")
+                    return found
             except (OSError, ValueError):
                 # Silently skip this license path if it cannot be read or parsed
                 continue
@@ -162,7 +252,7 @@ def get_version_name_from_system() -> str:
 
     # Method 4: Fallback to version number mapping
     try:
-        version = run(["sw_vers", "-productVersion"], log_errors=False).strip()
+        version = _sw_vers_all().get("ProductVersion", "")
         return get_version_name_from_number(version)
     except (OSError, ValueError):
         # Fallback silently if command execution or version parsing fails
@@ -171,10 +261,14 @@ def get_version_name_from_system() -> str:
     return "macOS"
 
 
+@functools.cache
 def get_macos_version_info() -> MacOSVersion:
     """
     Get comprehensive macOS version information.
 
+    Cached for the lifetime of the process; callers must not mutate the
+    returned dictionary.
+
     Returns:
         MacOSVersion dictionary with all version details
 
@@ -185,8 +279,9 @@ def get_macos_version_info() -> MacOSVersion:
         >>> info["marketing_name"]
         'macOS Monterey 12.7.6'
     """
-    version = run(["sw_vers", "-productVersion"], log_errors=False).strip()
-    build = run(["sw_vers", "-buildVersion"], log_errors=False).strip()
+    sw_vers = _sw_vers_all()
+    version = sw_vers.get("ProductVersion", "")
+    build = sw_vers.get("BuildVersion", "")
 
     major, minor, patch = parse_version_string(version)
 
@@ -195,7 +290,7 @@ def get_macos_version_info() -> MacOSVersion:
     if name == "macOS":
         name = get_version_name_from_number(version)
 
-    marketing_name = f"macOS {name} {version}"
+    marketing_name = f"macOS {name} {version}" if name != "macOS" else f"macOS {version}".rstrip()
 
     return {
         "version": version,
@@ -216,9 +311,9 @@ def get_all_macos_versions() -> list[dict[str, object]]:
         python3 scripts/scrape_macos_versions.py
 
     Returns:
-        List of dictionaries with version info
+        List of dictionaries with version info (shared; do not mutate)
     """
-    return _VERSIONS_DATA.get("versions", [])  # type: ignore[no-any-return]
+    return _load_versions_json().get("versions", [])  # type: ignore[no-any-return]
 
 
 __all__ = [
@@ -9,6 +9,30 @@ from __future__ import annotations
 import re
 
 
+# Uptime patterns are anchored on the literal "up " / "load average" landmarks
+# and use exact number shapes so non-matching input fails without backtracking.
+_DAYS_RE = re.compile(r"up +(\d+) days?", re.ASCII)
+_UP_RE = re.compile(r"up +(?:\d+ days?, +)?(\d+):(\d+)", re.ASCII)
+_BOOT_TIME_RE = re.compile(r"boot time: *(.+)")
+_LOAD_RE = re.compile(
+    r"load averages?: +(\d+(?:\.\d+)?) +(\d+(?:\.\d+)?) +(\d+(?:\.\d+)?)", re.ASCII
+)
+_SIZE_RE = re.compile(r"([\d.]+)\s*([KMGT]?B)", re.ASCII)
+_NULL_BYTES_RE = re.compile(r"%00|\x00")
+
+# Returned (as a copy) when no load average can be parsed
+_DEFAULT_LOAD: dict[str, float] = {"load_1m": 0.0, "load_5m": 0.0, "load_15m": 0.0}
+
+# Unit -> GB conversion factors for parse_size_to_gb
+_SIZE_TO_GB = {
+    "B": 1 / (1024**3),
+    "KB": 1 / (1024**2),
+    "MB": 1 / 1024,
+    "GB": 1.0,
+    "TB": 1024.0,
+}
+
+
 def parse_uptime(uptime_output: str) -> str:
     """Parse uptime command output to human-readable format.
 
@@ -26,8 +50,8 @@ def parse_uptime(uptime_output: str) -> str:
         return "Unknown"
 
     # Match patterns like "5 days" or "3:45" (hours:minutes)
-    days_match = re.search(r"(\d+)\s+day", uptime_output)
-    time_match = re.search(r"up\s+(?:\d+\s+days?,\s*)?(\d+):(\d+)", uptime_output)
+    days_match = _DAYS_RE.search(uptime_output)
+    time_match = _UP_RE.search(uptime_output)
 
     parts = []
     if days_match:
@@ -53,10 +77,9 @@ def parse_boot_time(uptime_output: str) -> str:
         return "Unknown"
 
     # Try to extract boot time if present
-    match = re.search(r"boot time:\s*(.+)", uptime_output)
+    match = _BOOT_TIME_RE.search(uptime_output)
     if match:
         return match.group(1).strip()
-
     return "Unknown"
 
 
@@ -73,13 +96,11 @@ def parse_load_average(uptime_output: str) -> dict[str, float]:
         >>> parse_load_average("10:30  up 5 days, load averages: 2.15 1.80 1.65")
         {"load_1m": 2.15, "load_5m": 1.80, "load_15m": 1.65}
     """
-    default = {"load_1m": 0.0, "load_5m": 0.0, "load_15m": 0.0}
-
     if not uptime_output:
-        return default
+        return dict(_DEFAULT_LOAD)
 
     # Match load average pattern
-    match = re.search(r"load averages?:\s*([\d.]+)\s+([\d.]+)\s+([\d.]+)", uptime_output)
+    match = _LOAD_RE.search(uptime_output)
     if match:
         try:
             return {
@@ -89,8 +110,7 @@ def parse_load_average(uptime_output: str) -> dict[str, float]:
             }
         except ValueError:
             pass
-
-    return default
+    return dict(_DEFAULT_LOAD)
 
 
 def parse_version_line(output: str) -> str:
@@ -115,8 +135,23 @@ def parse_version_line(output: str) -> str:
     return lines[0].strip() if lines else "Not installed"
 
 
+def _first_number_span(text: str, allow_dot: bool) -> str:
+    """Return the first run of digits (and dots, if allowed) in text."""
+    n = len(text)
+    i = 0
+    while i < n and not (text[i].isdecimal() or (allow_dot and text[i] == ".")):
+        i += 1
+    j = i
+    while j < n and (text[j].isdecimal() or (allow_dot and text[j] == ".")):
+        j += 1
+    return text[i:j]
+
+
 def parse_int_from_string(text: str, default: int = 0) -> int:
-    """Extract first integer from string using regex.
+    """Extract first integer from string.
+
+    Scans the string once instead of running a regex; for the short inputs
+    seen here the regex engine setup cost dominates.
 
     Args:
         text: String containing integers
@@ -131,17 +166,17 @@ def parse_int_from_string(text: str, default: int = 0) -> int:
         >>> parse_int_from_string("No numbers", default=0)
         0
     """
-    match = re.search(r"\d+", text)
-    if match:
+    digits = _first_number_span(text, allow_dot=False)
+    if digits:
         try:
-            return int(match.group(0))
+            return int(digits)
         except ValueError:
             pass
     return default
 
 
 def parse_float_from_string(text: str, default: float = 0.0) -> float:
-    """Extract first float from string using regex.
+    """Extract first float from string.
 
     Args:
         text: String containing floats
@@ -154,10 +189,10 @@ def parse_float_from_string(text: str, default: float = 0.0) -> float:
         >>> parse_float_from_string("Speed: 2.5 GHz")
         2.5
     """
-    match = re.search(r"[\d.]+", text)
-    if match:
+    number = _first_number_span(text, allow_dot=True)
+    if number:
         try:
-            return float(match.group(0))
+            return float(number)
         except ValueError:
             pass
     return default
@@ -241,6 +276,31 @@ def parse_key_value_line(line: str, separator: str = ":") -> tuple[str, str] | N
     return None
 
 
+def parse_key_value_block(text: str, separator: str = ":") -> dict[str, str]:
+    """Parse every "key: value" line of a block into a dict.
+
+    Batch form of parse_key_value_line(); lines without the separator are
+    skipped and later duplicates win.
+
+    Args:
+        text: Multi-line command output
+        separator: Separator character (default: ":")
+
+    Returns:
+        Dictionary of stripped keys to stripped values
+
+    Examples:
+        >>> parse_key_value_block("ProductName:\\tmacOS\\nBuildVersion:\\t23C71")
+        {"ProductName": "macOS", "BuildVersion": "23C71"}
+    """
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(separator)
+        if sep:
+            fields[key.strip()] = value.strip()
+    return fields
+
+
 def clean_null_bytes(text: str) -> str:
     """Remove null bytes from string (common in NVRAM data).
 
@@ -252,9 +312,9 @@ def clean_null_bytes(text: str) -> str:
 
     Examples:
         >>> clean_null_bytes("text%00with%00nulls")
-        "textwwithnullss"
+        "textwithnulls"
     """
-    return text.replace("%00", "").replace("\x00", "")
+    return _NULL_BYTES_RE.sub("", text)
 
 
 def parse_size_to_gb(size_str: str) -> float:
@@ -278,23 +338,11 @@ def parse_size_to_gb(size_str: str) -> float:
     size_str = size_str.upper().strip()
 
     # Extract number and unit
-    match = re.match(r"([\d.]+)\s*([KMGT]?B)", size_str)
+    match = _SIZE_RE.match(size_str)
     if not match:
         return 0.0
 
     try:
-        value = float(match.group(1))
-        unit = match.group(2)
-
-        # Convert to GB
-        multipliers = {
-            "B": 1 / (1024**3),
-            "KB": 1 / (1024**2),
-            "MB": 1 / 1024,
-            "GB": 1,
-            "TB": 1024,
-        }
-
-        return value * multipliers.get(unit, 1)
+        return float(match.group(1)) * _SIZE_TO_GB.get(match.group(2), 1.0)
     except ValueError:
         return 0.0
@@ -410,6 +410,31 @@ class SystemLogs(TypedDict):
     log_period: str  # e.g. "last 1 hour"
 
 
+class SystemInvariants(TypedDict):
+    """SystemInfo fields that cannot change until the next reboot."""
+
+    macos_version: str
+    macos_name: str
+    model_name: str
+    model_identifier: str
+    sip_enabled: bool | None  # None if csrutil failed; never cached
+
+
+class HardwareInvariants(TypedDict):
+    """HardwareInfo fields that cannot change until the next reboot."""
+
+    cpu: str
+    cpu_cores: int
+    memory_gb: float | None
+
+
+class BootCache(TypedDict, total=False):
+    """Per-boot invariants persisted by prose.cache; sections are filled lazily."""
+
+    system: SystemInvariants
+    hardware: HardwareInvariants
+
+
 class SystemReport(TypedDict):
     timestamp: float
     system: SystemInfo
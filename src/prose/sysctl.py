@@ -0,0 +1,145 @@
+"""
+In-process sysctl access using ctypes (no external dependencies).
+
+Reading a single kernel scalar through ``sysctl -n`` costs a fork+exec+pipe
+round trip. ``sysctlbyname(3)`` returns the same value directly from libc.
+Every helper returns None when the call is unavailable (non-macOS, missing
+name, ctypes failure) so callers can fall back to the ``sysctl`` command.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import struct
+import sys
+
+from prose.utils import verbose_log
+
+
+_libc: ctypes.CDLL | None = None
+_libc_loaded = False
+
+
+def _get_libc() -> ctypes.CDLL | None:
+    """Load libc once and declare the sysctlbyname prototype."""
+    global _libc, _libc_loaded
+    if not _libc_loaded:
+        _libc_loaded = True
+        if sys.platform == "darwin":
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "/usr/lib/libSystem.B.dylib")
+                libc.sysctlbyname.argtypes = [
+                    ctypes.c_char_p,
+                    ctypes.c_void_p,
+                    ctypes.POINTER(ctypes.c_size_t),
+                    ctypes.c_void_p,
+                    ctypes.c_size_t,
+                ]
+                libc.sysctlbyname.restype = ctypes.c_int
+                _libc = libc
+            except (OSError, AttributeError) as e:
+                verbose_log(f"sysctlbyname unavailable: {e}")
+    return _libc
+
+
+def sysctlbyname(name: str) -> bytes | None:
+    """Read the raw value of a sysctl.
+
+    Args:
+        name: sysctl name (e.g., "hw.memsize")
+
+    Returns:
+        Raw value bytes, or None if unavailable
+
+    Example:
+        >>> len(sysctlbyname("hw.memsize"))
+        8
+    """
+    libc = _get_libc()
+    if libc is None:
+        return None
+
+    encoded = name.encode("ascii")
+    size = ctypes.c_size_t(0)
+    if libc.sysctlbyname(encoded, None, ctypes.byref(size), None, 0) != 0:
+        return None
+    buf = ctypes.create_string_buffer(size.value)
+    if libc.sysctlbyname(encoded, buf, ctypes.byref(size), None, 0) != 0:
+        return None
+    return buf.raw[: size.value]
+
+
+def sysctl_int(name: str) -> int | None:
+    """Read an integer sysctl (32- or 64-bit).
+
+    Args:
+        name: sysctl name (e.g., "hw.ncpu")
+
+    Returns:
+        Integer value, or None if unavailable
+
+    Example:
+        >>> sysctl_int("hw.ncpu")
+        8
+    """
+    raw = sysctlbyname(name)
+    if raw is None or len(raw) not in (4, 8):
+        return None
+    return int.from_bytes(raw, sys.byteorder, signed=len(raw) == 4)
+
+
+def sysctl_string(name: str) -> str | None:
+    """Read a string sysctl.
+
+    Args:
+        name: sysctl name (e.g., "machdep.cpu.brand_string")
+
+    Returns:
+        Decoded string without the trailing NUL, or None if unavailable
+
+    Example:
+        >>> sysctl_string("machdep.cpu.brand_string")
+        'Apple M1'
+    """
+    raw = sysctlbyname(name)
+    if raw is None:
+        return None
+    return raw.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+
+
+def get_boot_time() -> tuple[int, int] | None:
+    """Read kern.boottime (struct timeval).
+
+    Returns:
+        (seconds, microseconds) since the epoch, or None if unavailable
+    """
+    raw = sysctlbyname("kern.boottime")
+    if raw is None or len(raw) < struct.calcsize("@li"):
+        return None
+    sec, usec = struct.unpack_from("@li", raw)
+    return sec, usec
+
+
+def get_load_average() -> tuple[float, float, float] | None:
+    """Read vm.loadavg (struct loadavg of fixed-point values).
+
+    Returns:
+        1, 5 and 15 minute load averages, or None if unavailable
+    """
+    raw = sysctlbyname("vm.loadavg")
+    if raw is None or len(raw) < struct.calcsize("@3Il"):
+        return None
+    one, five, fifteen, fscale = struct.unpack_from("@3Il", raw)
+    if not fscale:
+        return None
+    return one / fscale, five / fscale, fifteen / fscale
+
+
+__all__ = [
+    "get_boot_time",
+    "get_load_average",
+    "sysctl_int",
+    "sysctl_string",
+    "sysctlbyname",
+]
@@ -2,172 +2,203 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import ClassVar
-
+import asyncio
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import ClassVar, cast
+
+from rich.markup import escape
+from rich.text import Text
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Footer, Header, Static, TabbedContent, TabPane
+from textual.worker import Worker, WorkerState
 
 from prose.schema import SystemReport
 
 
-class SystemInfoCard(Static):
-    """Widget displaying system information."""
-
-    def __init__(self, data: SystemReport) -> None:
-        """Initialize system info card with data."""
-        super().__init__()
-        self.data = data
-
-    def render(self) -> str:
-        """Render system information."""
-        system = self.data.get("system", {})
-        model = system.get("model_name", "Unknown")
-        identifier = system.get("model_identifier", "Unknown")
-        macos = system.get("marketing_name", "Unknown")
-        arch = system.get("architecture", "Unknown")
-        board_id = system.get("board_id", "Unknown")
-
-        return f"""[bold cyan]System Information[/bold cyan]
-
-[yellow]Model:[/yellow] {model}
-[yellow]Identifier:[/yellow] {identifier}
-[yellow]macOS:[/yellow] {macos}
-[yellow]Architecture:[/yellow] {arch}
-[yellow]Board ID:[/yellow] {board_id}
-"""
-
-
-class SecurityCard(Static):
-    """Widget displaying security status."""
-
-    def __init__(self, data: SystemReport) -> None:
-        """Initialize security card with data."""
-        super().__init__()
-        self.data = data
-
-    def render(self) -> str:
-        """Render security status."""
-        system = self.data.get("system", {})
-        sip = system.get("sip_enabled", False)
-        filevault = system.get("filevault_enabled", False)
-        gatekeeper = system.get("gatekeeper_enabled", False)
-
-        sip_badge = "[green]✓ Enabled[/green]" if sip else "[red]✗ Disabled[/red]"
-        fv_badge = "[green]✓ Enabled[/green]" if filevault else "[red]✗ Disabled[/red]"
-        gk_badge = "[green]✓ Enabled[/green]" if gatekeeper else "[red]✗ Disabled[/red]"
-
-        return f"""[bold cyan]Security Status[/bold cyan]
-
-[yellow]SIP:[/yellow]        {sip_badge}
-[yellow]FileVault:[/yellow]  {fv_badge}
-[yellow]Gatekeeper:[/yellow] {gk_badge}
-"""
-
-
-class HardwareCard(Static):
-    """Widget displaying hardware information."""
-
-    def __init__(self, data: SystemReport) -> None:
-        """Initialize hardware card with data."""
-        super().__init__()
-        self.data = data
-
-    def render(self) -> str:
-        """Render hardware information."""
-        hardware = self.data.get("hardware", {})
-        cpu = hardware.get("cpu", "Unknown")
-        cores = hardware.get("cpu_cores", 0)
-        memory_gb = hardware.get("memory_gb")
-        memory = f"{memory_gb} GB" if memory_gb is not None else "Unknown"
-        gpu_list = hardware.get("gpu", ["Unknown"])
-        gpu = ", ".join(gpu_list) if gpu_list else "Unknown"
-
-        mem_pressure = hardware.get("memory_pressure", {})
-        mem_level = mem_pressure.get("level", "Unknown")
-        swap_used = mem_pressure.get("swap_used", "Unknown")
-
-        mem_color = "green" if mem_level == "normal" else "yellow" if mem_level == "warn" else "red"
-
-        return f"""[bold cyan]Hardware[/bold cyan]
-
-[yellow]CPU:[/yellow] {cpu}
-[yellow]Cores:[/yellow] {cores}
-[yellow]Memory:[/yellow] {memory}
-[yellow]GPU:[/yellow] {gpu}
-
-[yellow]Memory Pressure:[/yellow] [{mem_color}]{mem_level}[/{mem_color}]
-[yellow]Swap Used:[/yellow] {swap_used}
-"""
-
-
-class DeveloperCard(Static):
-    """Widget displaying developer tools."""
-
-    def __init__(self, data: SystemReport) -> None:
-        """Initialize developer card with data."""
-        super().__init__()
-        self.data = data
-
-    def render(self) -> str:
-        """Render developer tools information."""
-        dev = self.data.get("developer_tools", {})
-        docker = dev.get("docker", {})
-        git = dev.get("git", {})
-
-        docker_status = docker.get("status", "not installed")
-        docker_version = docker.get("version", "N/A")
-        docker_containers = docker.get("containers_running", 0) + docker.get(
-            "containers_stopped", 0
-        )
-        docker_images = docker.get("images", 0)
-
-        git_user = git.get("user_name", "Not configured")
-        git_email = git.get("user_email", "Not configured")
-
-        docker_color = "green" if docker_status == "running" else "red"
-
-        return f"""[bold cyan]Developer Tools[/bold cyan]
-
-[yellow]Docker:[/yellow] [{docker_color}]{docker_status}[/{docker_color}] (v{docker_version})
-[yellow]Containers:[/yellow] {docker_containers}
-[yellow]Images:[/yellow] {docker_images}
-
-[yellow]Git User:[/yellow] {git_user}
-[yellow]Git Email:[/yellow] {git_email}
-"""
-
-
-class PackagesCard(Static):
-    """Widget displaying package managers."""
+_GPU_DEFAULT: tuple[str, ...] = ("Unknown",)
+
+# Shared read-only stand-in for missing report sections, so lookups never
+# allocate a fresh {} default
+_EMPTY: Mapping[str, object] = MappingProxyType({})
+_EMPTY_REPORT = cast(SystemReport, _EMPTY)
+
+# Status badge indexed by the flag's truth value: _BADGE[bool(enabled)]
+_BADGE: tuple[str, str] = ("[red]✗ Disabled[/red]", "[green]✓ Enabled[/green]")
+
+# Memory pressure level -> color; anything else renders red
+_MEM_COLOR: dict[str, str] = {"normal": "green", "warn": "yellow"}
+
+
+_SYSTEM_INFO_TEMPLATE = (
+    "[bold cyan]System Information[/bold cyan]\n"
+    "\n"
+    "[yellow]Model:[/yellow] {model}\n"
+    "[yellow]Identifier:[/yellow] {identifier}\n"
+    "[yellow]macOS:[/yellow] {macos}\n"
+    "[yellow]Architecture:[/yellow] {arch}\n"
+    "[yellow]Board ID:[/yellow] {board_id}\n"
+)
+
+_SECURITY_TEMPLATE = (
+    "[bold cyan]Security Status[/bold cyan]\n"
+    "\n"
+    "[yellow]SIP:[/yellow]        {sip_badge}\n"
+    "[yellow]FileVault:[/yellow]  {fv_badge}\n"
+    "[yellow]Gatekeeper:[/yellow] {gk_badge}\n"
+)
+
+_HARDWARE_TEMPLATE = (
+    "[bold cyan]Hardware[/bold cyan]\n"
+    "\n"
+    "[yellow]CPU:[/yellow] {cpu}\n"
+    "[yellow]Cores:[/yellow] {cores}\n"
+    "[yellow]Memory:[/yellow] {memory}\n"
+    "[yellow]GPU:[/yellow] {gpu}\n"
+    "\n"
+    "[yellow]Memory Pressure:[/yellow] [{mem_color}]{mem_level}[/{mem_color}]\n"
+    "[yellow]Swap Used:[/yellow] {swap_used}\n"
+)
+
+_DEVELOPER_TEMPLATE = (
+    "[bold cyan]Developer Tools[/bold cyan]\n"
+    "\n"
+    "[yellow]Docker:[/yellow] [{docker_color}]{docker_status}[/{docker_color}]"
+    " (v{docker_version})\n"
+    "[yellow]Containers:[/yellow] {docker_containers}\n"
+    "[yellow]Images:[/yellow] {docker_images}\n"
+    "\n"
+    "[yellow]Git User:[/yellow] {git_user}\n"
+    "[yellow]Git Email:[/yellow] {git_email}\n"
+)
+
+_PACKAGES_TEMPLATE = (
+    "[bold cyan]Package Managers[/bold cyan]\n"
+    "\n"
+    "[yellow]Homebrew:[/yellow]\n"
+    "  • Formulas: {brew_formulas}\n"
+    "  • Casks: {brew_casks}\n"
+    "\n"
+    "[yellow]npm:[/yellow] {npm_count} packages\n"
+    "[yellow]Yarn:[/yellow] {yarn_count} packages\n"
+)
+
+
+def render_system_info(data: SystemReport) -> str:
+    """Render system information."""
+    system = data.get("system", _EMPTY)
+    # Escape report strings so stray "[" cannot be parsed as Rich markup
+    return _SYSTEM_INFO_TEMPLATE.format(
+        model=escape(str(system.get("model_name", "Unknown"))),
+        identifier=escape(str(system.get("model_identifier", "Unknown"))),
+        macos=escape(str(system.get("marketing_name", "Unknown"))),
+        arch=escape(str(system.get("architecture", "Unknown"))),
+        board_id=escape(str(system.get("board_id", "Unknown"))),
+    )
+
+
+def render_security(data: SystemReport) -> str:
+    """Render security status."""
+    system = data.get("system", _EMPTY)
+    return _SECURITY_TEMPLATE.format(
+        sip_badge=_BADGE[bool(system.get("sip_enabled", False))],
+        fv_badge=_BADGE[bool(system.get("filevault_enabled", False))],
+        gk_badge=_BADGE[bool(system.get("gatekeeper_enabled", False))],
+    )
+
+
+def render_hardware(data: SystemReport) -> str:
+    """Render hardware information."""
+    hardware = data.get("hardware", _EMPTY)
+    memory_gb = hardware.get("memory_gb")
+    mem_pressure = hardware.get("memory_pressure", _EMPTY)
+    mem_level = mem_pressure.get("level", "Unknown")
+
+    return _HARDWARE_TEMPLATE.format(
+        cpu=escape(str(hardware.get("cpu", "Unknown"))),
+        cores=hardware.get("cpu_cores", 0),
+        memory=f"{memory_gb} GB" if memory_gb is not None else "Unknown",
+        gpu=escape(", ".join(hardware.get("gpu") or _GPU_DEFAULT)),
+        mem_color=_MEM_COLOR.get(mem_level, "red"),
+        mem_level=mem_level,
+        swap_used=mem_pressure.get("swap_used", "Unknown"),
+    )
+
+
+def render_developer(data: SystemReport) -> str:
+    """Render developer tools information."""
+    dev = data.get("developer_tools", _EMPTY)
+    docker = dev.get("docker", _EMPTY)
+    git = dev.get("git_config") or _EMPTY
+
+    if docker.get("running"):
+        docker_status = "running"
+    elif docker.get("installed"):
+        docker_status = "stopped"
+    else:
+        docker_status = "not installed"
+
+    return _DEVELOPER_TEMPLATE.format(
+        docker_color="green" if docker_status == "running" else "red",
+        docker_status=docker_status,
+        docker_version=docker.get("version") or "N/A",
+        # The collector already counts every container (running or not)
+        docker_containers=docker.get("containers_total", 0),
+        docker_images=docker.get("images_count", 0),
+        git_user=escape(str(git.get("user_name") or "Not configured")),
+        git_email=escape(str(git.get("user_email") or "Not configured")),
+    )
+
+
+def _list_len(value: object) -> int:
+    """Length of a package list, 0 when it is None (not installed or not applicable)."""
+    return len(value) if isinstance(value, list) else 0
+
+
+def render_packages(data: SystemReport) -> str:
+    """Render package managers information."""
+    pkgs = data.get("package_managers", _EMPTY)
+    brew = pkgs.get("homebrew", _EMPTY)
+    npm_pkg = pkgs.get("npm", _EMPTY)
+    yarn_pkg = pkgs.get("yarn", _EMPTY)
+
+    return _PACKAGES_TEMPLATE.format(
+        brew_formulas=_list_len(brew.get("formula")),
+        brew_casks=_list_len(brew.get("casks")),
+        npm_count=_list_len(npm_pkg.get("globals")),
+        yarn_count=_list_len(yarn_pkg.get("globals")),
+    )
+
+
+class Card(Static):
+    """Dashboard card showing one section of the report.
+
+    Each card is parameterized by a render function of the app's report. The report
+    does not change between refreshes, so the markup is built and parsed into
+    a Rich Text once, and that Text is reused on every repaint until
+    invalidate() (returning a markup str would be re-parsed per repaint).
+    """
 
-    def __init__(self, data: SystemReport) -> None:
-        """Initialize packages card with data."""
+    def __init__(self, render_fn: Callable[[SystemReport], str]) -> None:
+        """Initialize card with its render function."""
         super().__init__()
-        self.data = data
-
-    def render(self) -> str:
-        """Render package managers information."""
-        pkgs = self.data.get("package_managers", {})
-        brew = pkgs.get("homebrew", {})
-        npm_pkg = pkgs.get("npm", {})
-        yarn_pkg = pkgs.get("yarn", {})
+        self.render_fn = render_fn
+        self._cached: Text | None = None
 
-        brew_formulas = brew.get("formulas", 0) if brew.get("installed") else 0
-        brew_casks = brew.get("casks", 0) if brew.get("installed") else 0
-        npm_count = npm_pkg.get("packages", 0) if npm_pkg.get("installed") else 0
-        yarn_count = yarn_pkg.get("packages", 0) if yarn_pkg.get("installed") else 0
+    def render(self) -> Text:
+        """Return the memoized, pre-parsed card text."""
+        if self._cached is None:
+            # The app holds the only reference to the current report
+            report = cast("SystemProseApp", self.app).report_data
+            self._cached = Text.from_markup(self.render_fn(report))
+        return self._cached
 
-        return f"""[bold cyan]Package Managers[/bold cyan]
-
-[yellow]Homebrew:[/yellow]
-  • Formulas: {brew_formulas}
-  • Casks: {brew_casks}
-
-[yellow]npm:[/yellow] {npm_count} packages
-[yellow]Yarn:[/yellow] {yarn_count} packages
-"""
+    def invalidate(self) -> None:
+        """Drop the memoized markup and repaint."""
+        self._cached = None
+        self.refresh()
 
 
 class SystemProseApp(App[None]):
@@ -207,16 +238,16 @@ class SystemProseApp(App[None]):
     }
     """
 
-    BINDINGS: ClassVar[Sequence[tuple[str, str, str]]] = [
+    BINDINGS: ClassVar[tuple[tuple[str, str, str], ...]] = (
         ("q", "quit", "Quit"),
         ("r", "refresh", "Refresh"),
         ("d", "toggle_dark", "Toggle Dark"),
-    ]
+    )
 
     def __init__(self, report_data: SystemReport | None = None) -> None:
         """Initialize app with optional report data."""
         super().__init__()
-        self.report_data: SystemReport = report_data or {}  # Type annotation added
+        self.report_data: SystemReport = report_data if report_data is not None else _EMPTY_REPORT
         self.title = "macOS System Prose TUI"
         self.sub_title = "Professional Terminal Dashboard"
 
@@ -228,22 +259,59 @@ class SystemProseApp(App[None]):
             with TabPane("Dashboard", id="dashboard"):
                 with Vertical(id="top-row"):
                     with Horizontal():
-                        yield SystemInfoCard(self.report_data).add_class("card")
-                        yield SecurityCard(self.report_data).add_class("card")
+                        yield Card(render_system_info).add_class("card")
+                        yield Card(render_security).add_class("card")
                     with Horizontal():
-                        yield HardwareCard(self.report_data).add_class("card")
-                        yield DeveloperCard(self.report_data).add_class("card")
+                        yield Card(render_hardware).add_class("card")
+                        yield Card(render_developer).add_class("card")
                 with Vertical(id="bottom-row"):
                     with Horizontal():
-                        yield PackagesCard(self.report_data).add_class("card")
+                        yield Card(render_packages).add_class("card")
                         yield Button("Refresh Data", id="refresh_btn", variant="primary")
 
         yield Footer()
 
+    def set_report(self, report_data: SystemReport) -> None:
+        """Swap in a freshly collected report and repaint the cards.
+
+        The collector dicts are used as-is, with no copy or conversion step;
+        cards read the report from the app when they next render.
+
+        Args:
+            report_data: New report, e.g. the result of collect_all().
+        """
+        self.report_data = report_data
+        for card in self.query(Card):
+            card.invalidate()
+
     def action_refresh(self) -> None:
-        """Refresh the data."""
-        self.notify("Refreshing data...", severity="information")
-        # In future, we'll implement async refresh here
+        """Collect a fresh report in the background."""
+        self._collect_report()
+
+    @work(thread=True, exclusive=True, exit_on_error=False)
+    def _collect_report(self) -> SystemReport:
+        """Run collect_all() on a worker thread so the UI keeps responding.
+
+        Process-lifetime snapshots are dropped first so a refresh reflects
+        changes made since the previous collection.
+        """
+        from prose.engine import collect_all
+        from prose.iokit import invalidate_nvram_cache
+        from prose.utils import invalidate_run_cache
+
+        invalidate_nvram_cache()
+        invalidate_run_cache()
+        return asyncio.run(collect_all())
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Apply a finished refresh, or report why it failed."""
+        worker = event.worker
+        if worker.name != "_collect_report":
+            return
+        if event.state == WorkerState.SUCCESS and worker.result is not None:
+            self.set_report(worker.result)
+        elif event.state == WorkerState.ERROR:
+            self.notify(f"Refresh failed: {worker.error}", severity="error")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
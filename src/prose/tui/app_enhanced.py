@@ -14,11 +14,17 @@ Professional terminal user interface implementing:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Sequence
+import heapq
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar, cast
 
+from rich.text import Text
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.coordinate import Coordinate
+from textual.widget import Widget
 from textual.widgets import (
     DataTable,
     Footer,
@@ -29,8 +35,20 @@ from textual.widgets import (
     TabbedContent,
     TabPane,
 )
-
-from prose.schema import SystemReport
+from textual.widgets.data_table import RowKey
+from textual.worker import Worker, WorkerState
+
+from prose.constants import DEFAULT_NOT_INSTALLED
+from prose.schema import (
+    APFSVolume,
+    DiskHealthInfo,
+    DiskInfo,
+    NotInstalled,
+    PackageManagers,
+    PackageVersionInfo,
+    SystemReport,
+    TimeMachineInfo,
+)
 
 
 if TYPE_CHECKING:
@@ -52,6 +70,277 @@ COLORS = {
 }
 
 
+def _title(title: str) -> Text:
+    return Text(title, style=f"bold {COLORS['blue']}")
+
+
+def _prefix(label: str) -> Text:
+    return Text.assemble((label, COLORS["gray"]), " ")
+
+
+def _field(prefix: Text, value: object) -> Text:
+    """Return a copy of a pre-built field prefix followed by a plain value."""
+    text = prefix.copy()
+    text.append(str(value))
+    return text
+
+
+# Labels are pre-built as rich Text at import, so compose() never runs the
+# markup parser for them
+_TITLE_SYSTEM_OVERVIEW = _title("System Overview")
+_TITLE_NETWORK = _title("Network")
+_TITLE_TOP_PROCESSES = _title("Top Processes (by CPU)")
+_TITLE_TOP_PROCESSES_CPU = _title("Top Processes (CPU)")
+_TITLE_BREW = _title("Homebrew Formulae")
+_TITLE_NPM = _title("npm Global Packages")
+_TITLE_LANGUAGES = _title("Installed Languages")
+_TITLE_SDKS = _title("Installed SDKs")
+_TITLE_STORAGE = _title("Storage Overview")
+_TITLE_VOLUMES = _title("APFS Volumes")
+_TITLE_DISK_HEALTH = _title("Physical Disk Health (S.M.A.R.T)")
+_TITLE_INTEGRITY = _title("System Integrity & Encryption")
+_TITLE_TIME_MACHINE = _title("Time Machine Backup")
+_TITLE_SYSTEM_DETAILS = _title("System Details")
+_TITLE_NETWORK_DETAILS = _title("Network Details")
+
+_FIELD_MODEL = _prefix("Model:")
+_FIELD_MACOS = _prefix("macOS:")
+_FIELD_KERNEL = _prefix("Kernel:")
+_FIELD_UPTIME = _prefix("Uptime:")
+_FIELD_DISK_USAGE = _prefix("Disk Usage:")
+_FIELD_MEM_PRESSURE = _prefix("Memory Pressure:")
+_FIELD_PUBLIC_IP = _prefix("Public IP:")
+_FIELD_INTERFACES = _prefix("Interfaces:")
+_FIELD_DNS_SERVERS = _prefix("DNS Servers:")
+
+# Value templates, formatted at compose time and again on every refresh
+_PERCENT_TEMPLATE = "{}%"
+_GB_TEMPLATE = "{} GB"
+_CAPACITY_TEMPLATE = "Total Capacity: {}"
+_FREE_SPACE_TEMPLATE = "Free Space: {}"
+_CPU_TEMPLATE = " {:.1f}%"
+_MEM_TEMPLATE = " {}"
+_DISK_TEMPLATE = " {:.0f}/{:.0f}G"
+_TASKS_TEMPLATE = "{} running processes"
+
+# MonitorHeader value label ids (val_<name>), in MonitorHeader._values() order
+_MONITOR_VALUES = ("cpu", "mem", "disk", "tasks", "load", "uptime", "model")
+
+# Indexed by bool: (False, True)
+_ENABLED = ("[red]Disabled[/]", "[green]Enabled[/]")
+_YES_NO = ("No", "Yes")
+_GREEN, _RED = "[green]", "[red]"
+
+_VPN_STATUS = (
+    Text.assemble(("VPN:", COLORS["gray"]), " ", ("Inactive", COLORS["gray"])),
+    Text.assemble(("VPN:", COLORS["gray"]), " ", ("✓ Active", COLORS["green"])),
+)
+_STATUS_BAR = (
+    Text("Static View", style=COLORS["gray"]),
+    Text("Live Mode: ON", style=COLORS["gray"]),
+)
+
+# Tabs whose widgets set_report() updates in place; other panes are rebuilt
+_LIVE_TABS = frozenset({"dashboard", "processes"})
+
+_HELP_TEXT = """
+[bold #007AFF]macOS System Prose - Keyboard Shortcuts[/]
+
+[#34C759]Navigation:[/]
+  1-7     Switch tabs
+  q       Quit application
+  d       Toggle dark theme
+
+[#34C759]Actions:[/]
+  r       Refresh data
+  Ctrl+E  Export to JSON
+  Ctrl+S  Search
+  ?       Show this help
+
+[#34C759]Features:[/]
+  • Real-time system monitoring
+  • Apple HIG design principles
+  • Professional terminal dashboard
+        """
+
+
+# DataTable column specs as (label, width); the label doubles as the column key
+_PROCESS_COLUMNS = (("Process", 30), ("PID", 10), ("CPU %", 10), ("Memory", 15))
+_BREW_COLUMNS = (("Formula", 30), ("Version", 20))
+_NPM_COLUMNS = (("Package", 30), ("Version", 20))
+_LANGUAGE_COLUMNS = (("Language", 20), ("Version", 30))
+_SDK_COLUMNS = (("SDK", 20), ("Version", 30))
+_VOLUME_COLUMNS = (
+    ("Volume Name", 30),
+    ("Used (GB)", 15),
+    ("Role", 15),
+    ("Encrypted", 10),
+    ("FileVault", 10),
+)
+_HEALTH_COLUMNS = (("Disk", 30), ("Type", 10), ("Status", 20))
+_SECURITY_COLUMNS = (("Feature", 30), ("Status", 40))
+_TIME_MACHINE_COLUMNS = (("Setting", 30), ("Value", 40))
+
+
+def _smart_status(status: str) -> str:
+    return (_GREEN if "Verified" in status else _RED) + status + "[/]"
+
+
+def _mk_table(columns: tuple[tuple[str, int], ...]) -> DataTable:
+    """Create a DataTable with the given (label, width) columns."""
+    table: DataTable = DataTable()
+    for label, width in columns:
+        table.add_column(label, width=width, key=label)
+    return table
+
+
+@dataclass
+class _UIData:
+    """Flat view of the report fields the widgets display.
+
+    Built once per report by _extract(), so widgets read plain attributes
+    instead of re-walking nested report dicts in compose().
+    """
+
+    # System
+    model: str
+    macos_version: str
+    kernel: str
+    uptime: str
+    load: list[str]
+    cpu_pct: float
+    mem_level: str
+    mem_pct: int
+
+    # Disk
+    has_disk: bool
+    disk_total_gb: float
+    disk_free_gb: float
+    volumes: list[APFSVolume]
+    disk_health: list[DiskHealthInfo]
+
+    # Processes
+    proc_count: int
+    process_rows: list[tuple[str, ...]]
+
+    # Network
+    public_ip: str
+    interface_count: int
+    vpn_active: bool
+    dns_count: int
+
+    # Packages and developer tools
+    formulae: list[str]
+    npm_globals: list[str]
+    languages: dict[str, str]
+    sdks: dict[str, str]
+
+    # Security
+    sip_enabled: bool
+    gatekeeper_enabled: bool
+    filevault_enabled: bool
+    time_machine: TimeMachineInfo
+
+
+def _top_process_rows(processes: object) -> list[tuple[str, ...]]:
+    """Build the table rows for a report's top processes."""
+    # Normalize to empty list if not a list
+    if not isinstance(processes, list):
+        processes = []
+
+    # Filter to dict-like items only (defensive against malformed data)
+    processes = [p for p in processes if isinstance(p, dict)]
+
+    # Top 100 rows by CPU like htop; a bounded heap avoids sorting the full
+    # list and leaves the report's list untouched
+    try:
+        top = heapq.nlargest(100, processes, key=lambda p: p.get("cpu_percent", 0) or 0)
+    except TypeError:
+        # Keep report order if comparison fails
+        top = processes[:100]
+
+    return [
+        (
+            proc.get("command", "?"),
+            str(proc.get("pid", "?")),
+            f"{proc.get('cpu_percent', 0):.1f}",
+            proc.get("memory", "?"),
+        )
+        for proc in top
+    ]
+
+
+def _package_list(manager: PackageVersionInfo | NotInstalled | None, key: str) -> list[str]:
+    """Return a manager's package list, or [] when absent or not installed."""
+    packages = manager.get(key) if manager is not None else None
+    return packages if isinstance(packages, list) else []
+
+
+def _extract(data: SystemReport) -> _UIData:
+    """Read every displayed field from a report in one pass."""
+    system = data.get("system", {})
+    hardware = data.get("hardware", {})
+    network: Mapping[str, object] = data.get("network", {})
+    pkg_mgrs = data.get("package_managers", cast(PackageManagers, {}))
+    dev_tools = data.get("developer_tools", {})
+
+    load = system.get("load_average", "0.0 0.0 0.0").split()
+    cores = hardware.get("cpu_cores", 8)
+    try:
+        cpu_pct = min(100, (float(load[0]) / cores) * 100)
+    except (ValueError, IndexError, ZeroDivisionError):
+        cpu_pct = 0.0
+    mem_level = hardware.get("memory_pressure", {}).get("level", "normal")
+
+    disk = data.get("disk", {})
+    has_disk = bool(disk) and isinstance(disk, dict)
+    if not has_disk:
+        disk = cast(DiskInfo, {})
+
+    processes = data.get("top_processes", [])
+
+    interfaces = network.get("interfaces", [])
+    dns = network.get("dns", {})
+    dns_servers = dns.get("servers", []) if isinstance(dns, dict) else []
+
+    return _UIData(
+        model=system.get("model_name", "Unknown"),
+        macos_version=system.get("macos_version", "Unknown"),
+        kernel=system.get("kernel", "Unknown"),
+        uptime=system.get("uptime", "Unknown"),
+        load=load,
+        cpu_pct=cpu_pct,
+        mem_level=mem_level,
+        mem_pct=30 if mem_level == "normal" else (60 if mem_level == "warn" else 90),
+        has_disk=has_disk,
+        disk_total_gb=disk.get("disk_total_gb", 0),
+        disk_free_gb=disk.get("disk_free_gb", 0),
+        # Flattened and filtered once, so the tables get uniform dict rows
+        volumes=[
+            vol
+            for container in disk.get("apfs_info", []) or []
+            if isinstance(container, dict)
+            for vol in container.get("volumes", []) or []
+            if isinstance(vol, dict)
+        ],
+        disk_health=[h for h in disk.get("disk_health", []) or [] if isinstance(h, dict)],
+        proc_count=len(processes),
+        process_rows=_top_process_rows(processes),
+        public_ip=str(network.get("public_ip", "Unknown")),
+        interface_count=len(interfaces) if isinstance(interfaces, list) else 0,
+        vpn_active=bool(network.get("vpn_active", False)),
+        dns_count=len(dns_servers) if isinstance(dns_servers, list) else 0,
+        formulae=_package_list(pkg_mgrs.get("homebrew"), "formula"),
+        npm_globals=_package_list(pkg_mgrs.get("npm"), "globals"),
+        languages=dev_tools.get("languages", {}),
+        sdks=dev_tools.get("sdks", {}),
+        sip_enabled=bool(system.get("sip_enabled")),
+        gatekeeper_enabled=bool(system.get("gatekeeper_enabled")),
+        filevault_enabled=bool(system.get("filevault_enabled")),
+        time_machine=system.get("time_machine", cast(TimeMachineInfo, {})),
+    )
+
+
 class StatsCard(Static):
     """Base card class with Apple HIG styling."""
 
@@ -70,47 +359,28 @@ class StatsCard(Static):
 class SystemOverviewCard(StatsCard):
     """System overview with progress bars for disk/memory."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        self.data = data
-        system = data.get("system", {})
-        self.model = system.get("model_name", "Unknown")
-        self.macos_version = system.get("macos_version", "Unknown")
-        self.kernel = system.get("kernel", "Unknown")
-        self.uptime = system.get("uptime", "Unknown")
-
-        # Memory pressure
-        hardware = data.get("hardware", {})
-        mem_pressure = hardware.get("memory_pressure", {})
-        self.mem_level = mem_pressure.get("level", "Unknown")
-
-        # Disk usage
-        disk = data.get("disk", {})
-        if disk:
-            self.disk_total = disk.get("disk_total_gb", 0)
-            self.disk_free = disk.get("disk_free_gb", 0)
-            self.disk_used = self.disk_total - self.disk_free
-            self.disk_percent = (
-                int((self.disk_used / self.disk_total) * 100) if self.disk_total > 0 else 0
-            )
-        else:
-            self.disk_percent = 0
+        self.ui = ui
+        disk_used = ui.disk_total_gb - ui.disk_free_gb
+        self.disk_percent = int(disk_used * 100 / ui.disk_total_gb) if ui.disk_total_gb > 0 else 0
 
     def compose(self) -> ComposeResult:
-        yield Label("[bold #007AFF]System Overview[/]")
-        yield Label(f"[#8E8E93]Model:[/] {self.model}")
-        yield Label(f"[#8E8E93]macOS:[/] {self.macos_version}")
-        yield Label(f"[#8E8E93]Kernel:[/] {self.kernel}")
-        yield Label(f"[#8E8E93]Uptime:[/] {self.uptime}")
+        ui = self.ui
+        yield Label(_TITLE_SYSTEM_OVERVIEW)
+        yield Label(_field(_FIELD_MODEL, ui.model))
+        yield Label(_field(_FIELD_MACOS, ui.macos_version))
+        yield Label(_field(_FIELD_KERNEL, ui.kernel))
+        yield Label(_field(_FIELD_UPTIME, ui.uptime))
         yield Label("")
-        yield Label(f"[#8E8E93]Disk Usage:[/] {self.disk_percent}%")
-        yield ProgressBar(total=100, show_eta=False, show_percentage=False)
-        yield Label(f"[#8E8E93]Memory Pressure:[/] {self.mem_level.title()}")
+        yield Label(_field(_FIELD_DISK_USAGE, _PERCENT_TEMPLATE.format(self.disk_percent)))
+        self._disk_bar = ProgressBar(total=100, show_eta=False, show_percentage=False)
+        yield self._disk_bar
+        yield Label(_field(_FIELD_MEM_PRESSURE, ui.mem_level.title()))
 
     def on_mount(self) -> None:
         """Update progress bar on mount."""
-        progress_bar = self.query_one(ProgressBar)
-        progress_bar.update(progress=self.disk_percent)
+        self._disk_bar.update(progress=self.disk_percent)
 
 
 class MonitorHeader(Static):
@@ -149,194 +419,211 @@ class MonitorHeader(Static):
     }
     """
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        self.data = data
-        self.cpu_pct = 0.0
-        self.mem_pct = 0.0
-        self.disk_pct = 0.0
+        self.ui = ui
+
+    def _values(self) -> tuple[float, tuple[str, ...]]:
+        """Return the disk percentage and the value label texts, in order."""
+        ui = self.ui
+        total_gb = ui.disk_total_gb
+        used_gb = total_gb - ui.disk_free_gb
+        disk_pct = used_gb * 100 / total_gb if total_gb > 0 else 0.0
+        return disk_pct, (
+            _CPU_TEMPLATE.format(ui.cpu_pct),
+            _MEM_TEMPLATE.format(ui.mem_level.title()),
+            _DISK_TEMPLATE.format(used_gb, total_gb),
+            _TASKS_TEMPLATE.format(ui.proc_count),
+            " ".join(ui.load),
+            str(ui.uptime),
+            str(ui.model),
+        )
 
     def compose(self) -> ComposeResult:
-        # Extract data
-        system = self.data.get("system", {})
-        hard = self.data.get("hardware", {})
-        disk = self.data.get("disk", {})
-        load = system.get("load_average", "0.0 0.0 0.0").split()
-        mem_pressure = hard.get("memory_pressure", {})
-
-        # Calculate Percentages
-        cores = hard.get("cpu_cores", 8)
-        try:
-            load_1min = float(load[0])
-            self.cpu_pct = min(100, (load_1min / cores) * 100)
-        except (ValueError, IndexError):
-            self.cpu_pct = 0.0
-
-        mem_level = mem_pressure.get("level", "normal")
-        self.mem_pct = 30 if mem_level == "normal" else (60 if mem_level == "warn" else 90)
-
-        used_gb = disk.get("disk_total_gb", 0) - disk.get("disk_free_gb", 0)
-        total_gb = disk.get("disk_total_gb", 1)
-        self.disk_pct = (used_gb / total_gb) * 100
+        self.disk_pct, texts = self._values()
+        # Widgets that change on refresh are kept so updates skip query_one()
+        self._pb_cpu = ProgressBar(total=100, show_eta=False, id="pb_cpu")
+        self._pb_mem = ProgressBar(total=100, show_eta=False, id="pb_mem")
+        self._pb_disk = ProgressBar(total=100, show_eta=False, id="pb_disk")
+        self._value_labels = tuple(
+            Label(text, classes="metric-value", id=f"val_{name}")
+            for name, text in zip(_MONITOR_VALUES, texts)
+        )
+        cpu, mem, disk, tasks, load, uptime, model = self._value_labels
 
         # CPU/Mem (Left Column)
         with Vertical():
             with Horizontal(classes="metric-row"):
                 yield Label("CPU Usage:", classes="metric-label")
-                yield ProgressBar(total=100, show_eta=False, id="pb_cpu")
-                yield Label(f" {self.cpu_pct:.1f}%", classes="metric-value")
+                yield self._pb_cpu
+                yield cpu
 
             with Horizontal(classes="metric-row"):
                 yield Label("Memory:", classes="metric-label")
-                yield ProgressBar(total=100, show_eta=False, id="pb_mem")
-                yield Label(f" {mem_level.title()}", classes="metric-value")
+                yield self._pb_mem
+                yield mem
 
             with Horizontal(classes="metric-row"):
                 yield Label("Disk /:", classes="metric-label")
-                yield ProgressBar(total=100, show_eta=False, id="pb_disk")
-                yield Label(f" {used_gb:.0f}/{total_gb:.0f}G", classes="metric-value")
+                yield self._pb_disk
+                yield disk
 
         # Info (Right Column)
         with Vertical():
             with Horizontal(classes="metric-row"):
                 yield Label("Tasks:", classes="metric-label")
-                proc_count = len(self.data.get("top_processes", []))
-                yield Label(f"{proc_count} running processes", classes="metric-value")
+                yield tasks
 
             with Horizontal(classes="metric-row"):
                 yield Label("Load Avg:", classes="metric-label")
-                yield Label(f"{' '.join(load)}", classes="metric-value")
+                yield load
 
             with Horizontal(classes="metric-row"):
                 yield Label("Uptime:", classes="metric-label")
-                yield Label(f"{system.get('uptime', 'Unknown')}", classes="metric-value")
+                yield uptime
 
             with Horizontal(classes="metric-row"):
                 yield Label("System:", classes="metric-label")
-                yield Label(f"{system.get('model_name')}", classes="metric-value")
+                yield model
 
     def on_mount(self) -> None:
         """Update progress bars."""
-        self.query_one("#pb_cpu", ProgressBar).update(progress=self.cpu_pct)
-        self.query_one("#pb_mem", ProgressBar).update(progress=self.mem_pct)
-        self.query_one("#pb_disk", ProgressBar).update(progress=self.disk_pct)
+        self._update_bars()
+
+    def _update_bars(self) -> None:
+        self._pb_cpu.update(progress=self.ui.cpu_pct)
+        self._pb_mem.update(progress=self.ui.mem_pct)
+        self._pb_disk.update(progress=self.disk_pct)
+
+    def update_data(self, ui: _UIData) -> None:
+        """Show metrics from a new report in the existing widgets.
+
+        Args:
+            ui: Display data extracted from a freshly collected report
+        """
+        self.ui = ui
+        self.disk_pct, texts = self._values()
+        self._update_bars()
+        for label, text in zip(self._value_labels, texts):
+            label.update(text)
 
 
 class NetworkOverviewCard(StatsCard):
     """Network overview with connection status."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        # MyPy can infer these types from SystemReport
-        network = data.get("network", {})
-        self.public_ip = network.get("public_ip", "Unknown")
-        interfaces = network.get("interfaces", [])
-        self.interface_count = len(interfaces) if isinstance(interfaces, list) else 0
-        self.vpn_active = network.get("vpn_active", False)
-
-        dns = network.get("dns", {})
-        dns_servers = dns.get("servers", []) if isinstance(dns, dict) else []
-        self.dns_servers = len(dns_servers) if isinstance(dns_servers, list) else 0
+        self.ui = ui
 
     def compose(self) -> ComposeResult:
-        yield Label("[bold #007AFF]Network[/]")
-        yield Label(f"[#8E8E93]Public IP:[/] {self.public_ip}")
-        yield Label(f"[#8E8E93]Interfaces:[/] {self.interface_count}")
-        yield Label(f"[#8E8E93]DNS Servers:[/] {self.dns_servers}")
-        vpn_status = "[#34C759]✓ Active[/]" if self.vpn_active else "[#8E8E93]Inactive[/]"
-        yield Label(f"[#8E8E93]VPN:[/] {vpn_status}")
+        ui = self.ui
+        yield Label(_TITLE_NETWORK)
+        yield Label(_field(_FIELD_PUBLIC_IP, ui.public_ip))
+        yield Label(_field(_FIELD_INTERFACES, ui.interface_count))
+        yield Label(_field(_FIELD_DNS_SERVERS, ui.dns_count))
+        yield Label(_VPN_STATUS[ui.vpn_active])
 
 
 class ProcessesTable(VerticalScroll):
     """DataTable for top processes."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, rows: list[tuple[str, ...]]) -> None:
         super().__init__()
-        self.data = data
+        self.rows = rows
+        self._table = _mk_table(_PROCESS_COLUMNS)
+        self._row_keys: dict[str, RowKey] = {}
+        self._rows: dict[str, tuple[str, ...]] = {}
+
+    def _fill(self, rows: list[tuple[str, ...]]) -> None:
+        """Replace every row, keying them by PID when PIDs are unique."""
+        self._table.clear()
+        keys = self._table.add_rows(rows)
+        by_pid = {row[1]: row for row in rows}
+        if len(by_pid) == len(rows):
+            self._rows = by_pid
+            self._row_keys = {row[1]: key for row, key in zip(rows, keys)}
+        else:
+            self._rows = {}
+            self._row_keys = {}
 
     def compose(self) -> ComposeResult:
-        table: DataTable = DataTable()
-        table.add_column("Process", width=30)
-        table.add_column("PID", width=10)
-        table.add_column("CPU %", width=10)
-        table.add_column("Memory", width=15)
-
-        # MyPy can infer this type from SystemReport
-        processes = self.data.get("top_processes", [])
-
-        # Normalize to empty list if not a list
-        if not isinstance(processes, list):
-            processes = []
-
-        # Filter to dict-like items only (defensive against malformed data)
-        processes = [p for p in processes if isinstance(p, dict)]
-
-        # Sort by CPU descending (just in case)
-        try:
-            processes.sort(key=lambda x: x.get("cpu_percent", 0), reverse=True)
-        except (TypeError, AttributeError):
-            # Silently skip sorting if comparison fails
-            pass
-
-        for proc in processes[:100]:  # Top 100 rows like htop
-            table.add_row(
-                proc.get("command", "?"),
-                str(proc.get("pid", "?")),
-                f"{proc.get('cpu_percent', 0):.1f}",
-                proc.get("memory", "?"),
-            )
+        table = self._table
+        self._fill(self.rows)
 
-        yield Label("[bold #007AFF]Top Processes (by CPU)[/]")
+        yield Label(_TITLE_TOP_PROCESSES)
         yield table
 
+    def update_rows(self, rows: list[tuple[str, ...]]) -> None:
+        """Show a new set of process rows, touching only changed cells.
+
+        Rows are matched by PID: surviving processes have their changed
+        cells updated in place, exited ones are removed and new ones are
+        appended in one batch before the table is re-sorted by CPU.
+
+        Args:
+            rows: Rows built by _top_process_rows() from a fresh report
+        """
+        self.rows = rows
+        new_rows = {row[1]: row for row in rows}
+        if not self._row_keys or len(new_rows) != len(rows):
+            self._fill(rows)
+            return
+
+        table = self._table
+        for pid in self._rows.keys() - new_rows.keys():
+            table.remove_row(self._row_keys.pop(pid))
+
+        added = []
+        for pid, row in new_rows.items():
+            old = self._rows.get(pid)
+            if old is None:
+                added.append(row)
+            elif old != row:
+                row_index = table.get_row_index(self._row_keys[pid])
+                for column, (before, after) in enumerate(zip(old, row)):
+                    if before != after:
+                        table.update_cell_at(Coordinate(row_index, column), after)
+
+        if added:
+            self._row_keys.update((row[1], key) for row, key in zip(added, table.add_rows(added)))
+        self._rows = new_rows
+        table.sort("CPU %", key=float, reverse=True)
+
 
 class PackagesTable(VerticalScroll):
     """DataTable for installed packages."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        self.data = data
+        self.ui = ui
 
     def compose(self) -> ComposeResult:
-        pkg_mgrs = self.data.get("package_managers", {})
-
         # Homebrew Formulae
-        yield Label("[bold #007AFF]Homebrew Formulae[/]")
-        brew_table: DataTable = DataTable()
-        brew_table.add_column("Formula", width=30)
-        brew_table.add_column("Version", width=20)
+        yield Label(_TITLE_BREW)
+        brew_table = _mk_table(_BREW_COLUMNS)
 
-        homebrew = cast("dict[str, list[str] | bool]", pkg_mgrs.get("homebrew", {}))
-        formulae = cast(list[str], homebrew.get("formula", []))
-
-        for formula in formulae[:50]:  # Limit to 50
-            if isinstance(formula, str):
-                brew_table.add_row(formula, "—")
-            else:
-                brew_table.add_row(
-                    formula.get("name", formula),
-                    formula.get("version", "—"),
-                )
+        formulae = self.ui.formulae
+        brew_table.add_rows(
+            (formula, "—")
+            if isinstance(formula, str)
+            else (formula.get("name", formula), formula.get("version", "—"))
+            for formula in formulae[:50]  # Limit to 50
+        )
 
         yield brew_table
 
         # NPM Global
         yield Label("")
-        yield Label("[bold #007AFF]npm Global Packages[/]")
-        npm_table: DataTable = DataTable()
-        npm_table.add_column("Package", width=30)
-        npm_table.add_column("Version", width=20)
-
-        npm_global = cast("dict[str, list[str] | bool]", pkg_mgrs.get("npm", {}))
-        npm_packages = cast(list[str], npm_global.get("globals", []))
-
-        for pkg in npm_packages[:30]:  # Limit to 30
-            # Format: "package@version"
-            if "@" in pkg:
-                name, version = pkg.rsplit("@", 1)
-                npm_table.add_row(name, version)
-            else:
-                npm_table.add_row(pkg, "—")
+        yield Label(_TITLE_NPM)
+        npm_table = _mk_table(_NPM_COLUMNS)
+
+        npm_packages = self.ui.npm_globals
+
+        # Format: "package@version"
+        npm_table.add_rows(
+            pkg.rsplit("@", 1) if "@" in pkg else (pkg, "—")
+            for pkg in npm_packages[:30]  # Limit to 30
+        )
 
         yield npm_table
 
@@ -344,37 +631,33 @@ class PackagesTable(VerticalScroll):
 class DeveloperToolsPanel(VerticalScroll):
     """Developer tools detailed view."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        self.data = data
+        self.ui = ui
 
     def compose(self) -> ComposeResult:
-        dev_tools = self.data.get("developer_tools", {})
-
         # Languages
-        yield Label("[bold #007AFF]Installed Languages[/]")
-        lang_table: DataTable = DataTable()
-        lang_table.add_column("Language", width=20)
-        lang_table.add_column("Version", width=30)
+        yield Label(_TITLE_LANGUAGES)
+        lang_table = _mk_table(_LANGUAGE_COLUMNS)
 
-        languages = dev_tools.get("languages", {})
-        for lang_name, version in languages.items():
-            if version and version != "Not installed":
-                lang_table.add_row(lang_name, version)
+        lang_table.add_rows(
+            (lang_name, version)
+            for lang_name, version in self.ui.languages.items()
+            if version and version != DEFAULT_NOT_INSTALLED
+        )
 
         yield lang_table
         yield Label("")
 
         # SDKs
-        yield Label("[bold #007AFF]Installed SDKs[/]")
-        sdk_table: DataTable = DataTable()
-        sdk_table.add_column("SDK", width=20)
-        sdk_table.add_column("Version", width=30)
+        yield Label(_TITLE_SDKS)
+        sdk_table = _mk_table(_SDK_COLUMNS)
 
-        sdks = dev_tools.get("sdks", {})
-        for sdk_name, version in sdks.items():
-            if version and version != "Not installed":
-                sdk_table.add_row(sdk_name, version)
+        sdk_table.add_rows(
+            (sdk_name, version)
+            for sdk_name, version in self.ui.sdks.items()
+            if version and version != DEFAULT_NOT_INSTALLED
+        )
 
         yield sdk_table
 
@@ -382,115 +665,93 @@ class DeveloperToolsPanel(VerticalScroll):
 class StorageDetails(VerticalScroll):
     """Detailed storage analysis."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        self.data = data
+        self.ui = ui
 
     def compose(self) -> ComposeResult:
-        disk = self.data.get("disk", {})
+        ui = self.ui
 
         # Overview
-        valid_disk = disk and isinstance(disk, dict)
-        total = f"{disk.get('disk_total_gb', 0)} GB" if valid_disk else "?"
-        free = f"{disk.get('disk_free_gb', 0)} GB" if valid_disk else "?"
+        total = _GB_TEMPLATE.format(ui.disk_total_gb) if ui.has_disk else "?"
+        free = _GB_TEMPLATE.format(ui.disk_free_gb) if ui.has_disk else "?"
 
-        yield Label("[bold #007AFF]Storage Overview[/]")
-        yield Label(f"Total Capacity: {total}")
-        yield Label(f"Free Space: {free}")
+        yield Label(_TITLE_STORAGE)
+        yield Label(_CAPACITY_TEMPLATE.format(total))
+        yield Label(_FREE_SPACE_TEMPLATE.format(free))
         yield Label("")
 
         # Volumes Table
-        yield Label("[bold #007AFF]APFS Volumes[/]")
-        vol_table: DataTable = DataTable()
-        vol_table.add_column("Volume Name", width=30)
-        vol_table.add_column("Used (GB)", width=15)
-        vol_table.add_column("Role", width=15)
-        vol_table.add_column("Encrypted", width=10)
-        vol_table.add_column("FileVault", width=10)
-
-        if valid_disk:
-            containers = disk.get("apfs_info", []) or []
-            for container in containers:
-                if isinstance(container, dict):
-                    volumes = container.get("volumes", []) or []
-                    for vol in volumes:
-                        if isinstance(vol, dict):
-                            is_encrypted = "Yes" if vol.get("encrypted") else "No"
-                            is_fv = "Yes" if vol.get("filevault") else "No"
-                            vol_table.add_row(
-                                str(vol.get("name", "Unknown")),
-                                f"{vol.get('capacity_used_gb', 0)}",
-                                str(vol.get("role", "Unknown")),
-                                is_encrypted,
-                                is_fv,
-                            )
+        yield Label(_TITLE_VOLUMES)
+        vol_table = _mk_table(_VOLUME_COLUMNS)
+
+        vol_table.add_rows(
+            (
+                str(vol.get("name", "Unknown")),
+                f"{vol.get('capacity_used_gb', 0)}",
+                str(vol.get("role", "Unknown")),
+                _YES_NO[bool(vol.get("encrypted"))],
+                _YES_NO[bool(vol.get("filevault"))],
+            )
+            for vol in ui.volumes
+        )
         yield vol_table
         yield Label("")
 
         # Disk Health
-        yield Label("[bold #007AFF]Physical Disk Health (S.M.A.R.T)[/]")
-        health_table: DataTable = DataTable()
-        health_table.add_column("Disk", width=30)
-        health_table.add_column("Type", width=10)
-        health_table.add_column("Status", width=20)
-
-        if valid_disk:
-            health_info = disk.get("disk_health", []) or []
-            for h in health_info:
-                if isinstance(h, dict):
-                    status = str(h.get("smart_status", "Unknown"))
-                    color = "[green]" if "Verified" in status else "[red]"
-                    health_table.add_row(
-                        str(h.get("disk_name", "Unknown")),
-                        str(h.get("disk_type", "Unknown")),
-                        f"{color}{status}[/]",
-                    )
+        yield Label(_TITLE_DISK_HEALTH)
+        health_table = _mk_table(_HEALTH_COLUMNS)
+
+        health_table.add_rows(
+            (
+                str(h.get("disk_name", "Unknown")),
+                str(h.get("disk_type", "Unknown")),
+                _smart_status(str(h.get("smart_status", "Unknown"))),
+            )
+            for h in ui.disk_health
+        )
         yield health_table
 
 
 class SecurityDetails(VerticalScroll):
     """Detailed security analysis."""
 
-    def __init__(self, data: SystemReport) -> None:
+    def __init__(self, ui: _UIData) -> None:
         super().__init__()
-        self.data = data
+        self.ui = ui
 
     def compose(self) -> ComposeResult:
-        system = self.data.get("system", {})
-
-        yield Label("[bold #007AFF]System Integrity & Encryption[/]")
-        sec_table: DataTable = DataTable()
-        sec_table.add_column("Feature", width=30)
-        sec_table.add_column("Status", width=40)
-
-        sip = "Enabled" if system.get("sip_enabled") else "Disabled"
-        gk = "Enabled" if system.get("gatekeeper_enabled") else "Disabled"
-        fv = "Enabled" if system.get("filevault_enabled") else "Disabled"
-
-        sip_status = f"[{'green' if sip == 'Enabled' else 'red'}]{sip}[/]"
-        gk_status = f"[{'green' if gk == 'Enabled' else 'red'}]{gk}[/]"
-        fv_status = f"[{'green' if fv == 'Enabled' else 'red'}]{fv}[/]"
-
-        sec_table.add_row("SIP (System Integrity)", sip_status)
-        sec_table.add_row("Gatekeeper", gk_status)
-        sec_table.add_row("FileVault (Disk Encryption)", fv_status)
+        ui = self.ui
+
+        yield Label(_TITLE_INTEGRITY)
+        sec_table = _mk_table(_SECURITY_COLUMNS)
+
+        sec_table.add_rows(
+            [
+                ("SIP (System Integrity)", _ENABLED[ui.sip_enabled]),
+                ("Gatekeeper", _ENABLED[ui.gatekeeper_enabled]),
+                ("FileVault (Disk Encryption)", _ENABLED[ui.filevault_enabled]),
+            ]
+        )
         yield sec_table
         yield Label("")
 
         # Time Machine
-        tm = system.get("time_machine", {})
-        yield Label("[bold #007AFF]Time Machine Backup[/]")
-        tm_table: DataTable = DataTable()
-        tm_table.add_column("Setting", width=30)
-        tm_table.add_column("Value", width=40)
-
-        tm_enabled = "Yes" if tm.get("enabled") else "No"
-        tm_auto = "Yes" if tm.get("auto_backup") else "No"
-
-        tm_table.add_row("Time Machine Active", tm_enabled)
-        tm_table.add_row("Auto Backup", tm_auto)
-        tm_table.add_row("Last Backup", str(tm.get("last_backup", "None")))
-        tm_table.add_row("Destination", str(tm.get("destination", "None")))
+        tm = ui.time_machine
+        yield Label(_TITLE_TIME_MACHINE)
+        tm_table = _mk_table(_TIME_MACHINE_COLUMNS)
+
+        tm_enabled = _YES_NO[bool(tm.get("enabled"))]
+        tm_auto = _YES_NO[bool(tm.get("auto_backup"))]
+
+        tm_table.add_rows(
+            [
+                ("Time Machine Active", tm_enabled),
+                ("Auto Backup", tm_auto),
+                ("Last Backup", str(tm.get("last_backup", "None"))),
+                ("Destination", str(tm.get("destination", "None"))),
+            ]
+        )
 
         yield tm_table
 
@@ -558,14 +819,14 @@ class SystemProseAppEnhanced(App[None]):
         ("ctrl+e", "export", "Export JSON"),
         ("ctrl+s", "search", "Search"),
         ("question_mark", "help", "Help"),
-        ("1", "tab_dashboard", "Dashboard"),
-        ("2", "tab_system", "System"),
-        ("3", "tab_network", "Network"),
-        ("4", "tab_developer", "Developer"),
-        ("5", "tab_packages", "Packages"),
-        ("6", "tab_processes", "Processes"),
-        ("7", "tab_storage", "Storage"),
-        ("8", "tab_security", "Security"),
+        ("1", "tab('dashboard')", "Dashboard"),
+        ("2", "tab('system')", "System"),
+        ("3", "tab('network')", "Network"),
+        ("4", "tab('developer')", "Developer"),
+        ("5", "tab('packages')", "Packages"),
+        ("6", "tab('processes')", "Processes"),
+        ("7", "tab('storage')", "Storage"),
+        ("8", "tab('security')", "Security"),
     ]
 
     def __init__(
@@ -587,75 +848,136 @@ class SystemProseAppEnhanced(App[None]):
         self.refresh_interval = refresh_interval
         self.title = "macOS System Prose"
         self.sub_title = "Professional Terminal Dashboard • Apple HIG Design"
-        self._refresh_task: asyncio.Task[None] | None = None
+        self._mounted_tabs: set[str] = set()
+        self._ui = _extract(self.report_data)
 
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
         yield Header(show_clock=True)
 
+        # Panes start empty; their widgets are built when first shown
         with TabbedContent(initial="dashboard"):
-            # Tab 1: Dashboard (Monitor)
-            with TabPane("Monitor", id="dashboard"):
-                yield MonitorHeader(self.report_data)
-                yield Label("[bold #007AFF]Top Processes (CPU)[/]")
-                yield ProcessesTable(self.report_data)
-
-            # Tab 2: System Details
-            with TabPane("System", id="system"):
-                yield Label("[bold #007AFF]System Details[/]")
-                yield Label("Detailed system information...")
-
-            # Tab 3: Network Details
-            with TabPane("Network", id="network"):
-                yield Label("[bold #007AFF]Network Details[/]")
-                yield Label("Network configuration...")
-
-            # Tab 4: Developer Tools
-            with TabPane("Developer", id="developer"):
-                yield DeveloperToolsPanel(self.report_data)
-
-            # Tab 5: Packages
-            with TabPane("Packages", id="packages"):
-                yield PackagesTable(self.report_data)
-
-            # Tab 6: Processes
-            with TabPane("Processes", id="processes"):
-                yield ProcessesTable(self.report_data)
-
-            # Tab 7: Storage
-            with TabPane("Storage", id="storage"):
-                yield StorageDetails(self.report_data)
-
-            # Tab 8: Security
-            with TabPane("Security", id="security"):
-                yield SecurityDetails(self.report_data)
+            yield TabPane("Monitor", id="dashboard")
+            yield TabPane("System", id="system")
+            yield TabPane("Network", id="network")
+            yield TabPane("Developer", id="developer")
+            yield TabPane("Packages", id="packages")
+            yield TabPane("Processes", id="processes")
+            yield TabPane("Storage", id="storage")
+            yield TabPane("Security", id="security")
 
         # Status bar
-        status_text = "Live Mode: ON" if self.live_mode else "Static View"
-        yield Label(f"[#8E8E93]{status_text}[/]", id="status_bar")
+        yield Label(_STATUS_BAR[self.live_mode], id="status_bar")
 
         yield Footer()
 
+    def _build_pane(self, tab_id: str) -> list[Widget]:
+        """Create the widgets for one tab."""
+        ui = self._ui
+        if tab_id == "dashboard":
+            return [
+                MonitorHeader(ui),
+                Label(_TITLE_TOP_PROCESSES_CPU),
+                ProcessesTable(ui.process_rows),
+            ]
+        if tab_id == "system":
+            return [
+                Label(_TITLE_SYSTEM_DETAILS),
+                Label("Detailed system information..."),
+            ]
+        if tab_id == "network":
+            return [
+                Label(_TITLE_NETWORK_DETAILS),
+                Label("Network configuration..."),
+            ]
+        if tab_id == "developer":
+            return [DeveloperToolsPanel(ui)]
+        if tab_id == "packages":
+            return [PackagesTable(ui)]
+        if tab_id == "processes":
+            return [ProcessesTable(ui.process_rows)]
+        if tab_id == "storage":
+            return [StorageDetails(ui)]
+        if tab_id == "security":
+            return [SecurityDetails(ui)]
+        return []
+
+    def _populate_pane(self, pane: TabPane) -> None:
+        """Mount a pane's widgets the first time it is activated."""
+        if pane.id is None or pane.id in self._mounted_tabs:
+            return
+        self._mounted_tabs.add(pane.id)
+        pane.mount_all(self._build_pane(pane.id))
+
     def on_mount(self) -> None:
-        """Start live refresh if enabled."""
+        """Populate the initial pane and start live refresh if enabled."""
+        self._tabs = self.query_one(TabbedContent)
+        active = self._tabs.active_pane
+        if active is not None:
+            self._populate_pane(active)
         if self.live_mode:
-            self._refresh_task = asyncio.create_task(self._live_refresh_loop())
-
-    def on_unmount(self) -> None:
-        """Stop live refresh on unmount."""
-        if self._refresh_task:
-            self._refresh_task.cancel()
+            self.set_interval(self.refresh_interval, self.action_refresh)
 
-    async def _live_refresh_loop(self) -> None:
-        """Background loop for auto-refreshing data in live mode."""
-        while True:
-            await asyncio.sleep(self.refresh_interval)
-            self.action_refresh()
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Populate a pane on first activation."""
+        self._populate_pane(event.pane)
 
     def action_refresh(self) -> None:
         """Refresh the data."""
         self.notify("🔄 Refreshing data...", title="Refresh", severity="information")
-        # In production, this would re-run collect_all()
+        self._collect_report()
+
+    @work(thread=True, exclusive=True, exit_on_error=False)
+    def _collect_report(self) -> SystemReport:
+        """Run collect_all() on a worker thread so the UI keeps responding.
+
+        Process-lifetime snapshots are dropped first so a refresh reflects
+        changes made since the previous collection.
+        """
+        from prose.engine import collect_all
+        from prose.iokit import invalidate_nvram_cache
+        from prose.utils import invalidate_run_cache
+
+        invalidate_nvram_cache()
+        invalidate_run_cache()
+        return asyncio.run(collect_all())
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Apply a finished refresh, or report why it failed."""
+        worker = event.worker
+        if worker.name != "_collect_report":
+            return
+        if event.state == WorkerState.SUCCESS and worker.result is not None:
+            self.set_report(worker.result)
+        elif event.state == WorkerState.ERROR:
+            self.notify(f"Refresh failed: {worker.error}", title="Refresh", severity="error")
+
+    def set_report(self, report_data: SystemReport) -> None:
+        """Swap in a freshly collected report.
+
+        The monitor header and process tables update their existing widgets
+        in place. Other opened panes render the report once when built, so
+        they are emptied: the active one is rebuilt now, the rest on their
+        next activation. Panes never opened build from the new report as usual.
+
+        Args:
+            report_data: New report, e.g. the result of collect_all().
+        """
+        self.report_data = report_data
+        self._ui = ui = _extract(report_data)
+        for header in self.query(MonitorHeader):
+            header.update_data(ui)
+        for table in self.query(ProcessesTable):
+            table.update_rows(ui.process_rows)
+
+        active = self._tabs.active
+        for tab_id in self._mounted_tabs - _LIVE_TABS:
+            pane = self._tabs.get_pane(tab_id)
+            pane.remove_children()
+            if tab_id == active:
+                pane.mount_all(self._build_pane(tab_id))
+            else:
+                self._mounted_tabs.discard(tab_id)
 
     def action_export(self) -> None:
         """Export data to JSON."""
@@ -667,58 +989,11 @@ class SystemProseAppEnhanced(App[None]):
 
     def action_help(self) -> None:
         """Show help screen."""
-        help_text = """
-[bold #007AFF]macOS System Prose - Keyboard Shortcuts[/]
-
-[#34C759]Navigation:[/]
-  1-7     Switch tabs
-  q       Quit application
-  d       Toggle dark theme
-
-[#34C759]Actions:[/]
-  r       Refresh data
-  Ctrl+E  Export to JSON
-  Ctrl+S  Search
-  ?       Show this help
-
-[#34C759]Features:[/]
-  • Real-time system monitoring
-  • Apple HIG design principles
-  • Professional terminal dashboard
-        """
-        self.notify(help_text, title="Help", timeout=10)
-
-    def action_tab_dashboard(self) -> None:
-        """Switch to dashboard tab."""
-        self.query_one(TabbedContent).active = "dashboard"
-
-    def action_tab_system(self) -> None:
-        """Switch to system tab."""
-        self.query_one(TabbedContent).active = "system"
-
-    def action_tab_network(self) -> None:
-        """Switch to network tab."""
-        self.query_one(TabbedContent).active = "network"
-
-    def action_tab_developer(self) -> None:
-        """Switch to developer tab."""
-        self.query_one(TabbedContent).active = "developer"
-
-    def action_tab_packages(self) -> None:
-        """Switch to packages tab."""
-        self.query_one(TabbedContent).active = "packages"
-
-    def action_tab_processes(self) -> None:
-        """Switch to processes tab."""
-        self.query_one(TabbedContent).active = "processes"
-
-    def action_tab_storage(self) -> None:
-        """Switch to storage tab."""
-        self.query_one(TabbedContent).active = "storage"
+        self.notify(_HELP_TEXT, title="Help", timeout=10)
 
-    def action_tab_security(self) -> None:
-        """Switch to security tab."""
-        self.query_one(TabbedContent).active = "security"
+    def action_tab(self, tab_id: str) -> None:
+        """Switch to the given tab."""
+        self._tabs.active = tab_id
 
 
 async def run_tui_enhanced(
@@ -7,9 +7,16 @@ parsing output, logging, and file operations.
 from __future__ import annotations
 
 import asyncio
+import fnmatch
+import functools
 import json
+import os
+import plistlib
+import re
 import shutil
+import struct
 import subprocess
+import sys
 from pathlib import Path
 from typing import Callable
 
@@ -37,6 +44,17 @@ class Colors:
     DIM = "\033[2m"
 
 
+_LEVEL_COLORS = {
+    "info": Colors.CYAN,
+    "success": Colors.GREEN,
+    "warning": Colors.YELLOW,
+    "error": Colors.RED,
+    "header": Colors.BOLD + Colors.BLUE,
+}
+_LINE_END = Colors.ENDC + "\n"
+_VERBOSE_PREFIX = Colors.DIM + "  -> "
+
+
 def log(msg: str, level: str = "info") -> None:
     """Log a message with color coding based on severity level.
 
@@ -46,14 +64,7 @@ def log(msg: str, level: str = "info") -> None:
     """
     if QUIET:
         return
-    colors = {
-        "info": Colors.CYAN,
-        "success": Colors.GREEN,
-        "warning": Colors.YELLOW,
-        "error": Colors.RED,
-        "header": Colors.BOLD + Colors.BLUE,
-    }
-    print(f"{colors.get(level, '')}{msg}{Colors.ENDC}")
+    sys.stdout.write(_LEVEL_COLORS.get(level, "") + msg + _LINE_END)
 
 
 def verbose_log(msg: str) -> None:
@@ -63,7 +74,7 @@ def verbose_log(msg: str) -> None:
         msg: The debug message to log.
     """
     if VERBOSE and not QUIET:
-        print(f"{Colors.DIM}  -> {msg}{Colors.ENDC}")
+        sys.stdout.write(_VERBOSE_PREFIX + msg + _LINE_END)
 
 
 def has_full_disk_access() -> bool:
@@ -117,6 +128,7 @@ def run(
     timeout: int = 15,
     log_errors: bool = True,
     capture_stderr: bool = False,
+    cacheable: bool = False,
 ) -> str:
     """Execute a system command and return its output.
 
@@ -126,6 +138,9 @@ def run(
         timeout: Maximum time in seconds to wait for command completion.
         log_errors: Whether to log errors to console.
         capture_stderr: If True, return stderr instead of stdout (for tools like codesign).
+        cacheable: If True, reuse the non-empty output of an identical earlier
+            call in this process. Only for read-only commands whose output
+            cannot change during a run (version probes, bundle metadata).
 
     Returns:
         Command output as a string, or empty string on failure.
@@ -140,24 +155,68 @@ def run(
     """
     if description:
         verbose_log(description)
+    if not cacheable:
+        return _run_process(cmd, timeout, log_errors, capture_stderr)
+
+    key = (tuple(cmd), capture_stderr, timeout, log_errors)
+    cached = _run_memo.get(key)
+    if cached is not None:
+        return cached
+    output = _run_process(cmd, timeout, log_errors, capture_stderr)
+    # Failures and timeouts come back empty; never pin them for the process
+    if output:
+        if len(_run_memo) >= _RUN_MEMO_SIZE:
+            del _run_memo[next(iter(_run_memo))]
+        _run_memo[key] = output
+    return output
+
+
+# Output of successful cacheable run() calls, oldest first
+_run_memo: dict[tuple[tuple[str, ...], bool, int, bool], str] = {}
+_RUN_MEMO_SIZE = 1024
+
+
+def invalidate_run_cache() -> None:
+    """Discard memoized command output and which() lookups.
+
+    Cacheable commands run again and tools installed or removed since the
+    last collection are looked up afresh.
+    """
+    _run_memo.clear()
+    _which_cached.cache_clear()
+
+
+def _decode(output: bytes) -> str:
+    return output.decode("utf-8", errors="replace").strip()
+
+
+def _run_process(cmd: list[str], timeout: int, log_errors: bool, capture_stderr: bool) -> str:
+    """Spawn cmd and return its stripped output (the uncached body of run())."""
+    # Raw bytes are decoded once, and only for the stream actually returned or
+    # logged; stderr is not piped at all when nobody will read it.
+    want_stderr = capture_stderr or log_errors
     try:
+        # No shell, preexec_fn or new session: keep the spawn as cheap as
+        # subprocess allows. stdin is closed so a tool can never block on the tty.
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if want_stderr else subprocess.DEVNULL,
             timeout=timeout,
         )
         if result.returncode != 0:
+            stderr_text = _decode(result.stderr) if want_stderr else ""
             if log_errors:
-                verbose_log(f"Command failed: {' '.join(cmd)}\nError: {result.stderr.strip()}")
+                verbose_log(f"Command failed: {' '.join(cmd)}\nError: {stderr_text}")
             # For commands that write to stderr (like codesign), return stderr even on error
-            if capture_stderr and result.stderr:
-                return result.stderr.strip()
+            if capture_stderr:
+                return stderr_text
             return ""
         # Return stderr if requested (some tools write to stderr by design)
         if capture_stderr:
-            return result.stderr.strip()
-        return result.stdout.strip()
+            return _decode(result.stderr)
+        return _decode(result.stdout)
     except subprocess.TimeoutExpired:
         if log_errors:
             verbose_log(f"Command timed out: {' '.join(cmd)}")
@@ -195,9 +254,34 @@ async def async_run_command(
     """
     if description:
         verbose_log(description)
+    result = await _async_exec(cmd, timeout, log_errors)
+    if result is None:
+        return ""
+    returncode, stdout, stderr = result
+
+    if returncode != 0:
+        stderr_text = _decode(stderr)
+        if log_errors:
+            verbose_log(f"Command failed: {' '.join(cmd)}\nError: {stderr_text}")
+        # For commands that write to stderr (like codesign), return stderr even on error
+        if capture_stderr:
+            return stderr_text
+        return ""
+
+    # Return stderr if requested (some tools write to stderr by design)
+    if capture_stderr:
+        return _decode(stderr)
+    return _decode(stdout)
+
+
+async def _async_exec(
+    cmd: list[str], timeout: int, log_errors: bool
+) -> tuple[int, bytes, bytes] | None:
+    """Spawn cmd and collect (returncode, stdout, stderr), or None on timeout/error."""
     try:
         process = await asyncio.create_subprocess_exec(
             *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -220,28 +304,14 @@ async def async_run_command(
                     verbose_log(f"Error terminating process: {e}")
             if log_errors:
                 verbose_log(f"Command timed out: {' '.join(cmd)}")
-            return ""
+            return None
 
-        stdout_text = stdout.decode("utf-8", errors="replace").strip()
-        stderr_text = stderr.decode("utf-8", errors="replace").strip()
-
-        if process.returncode != 0:
-            if log_errors:
-                verbose_log(f"Command failed: {' '.join(cmd)}\nError: {stderr_text}")
-            # For commands that write to stderr (like codesign), return stderr even on error
-            if capture_stderr and stderr_text:
-                return stderr_text
-            return ""
-
-        # Return stderr if requested (some tools write to stderr by design)
-        if capture_stderr:
-            return stderr_text
-        return stdout_text
+        return process.returncode or 0, stdout, stderr
 
     except Exception as e:
         if log_errors:
             verbose_log(f"Command execution error: {e}")
-        return ""
+        return None
 
 
 async def async_get_json_output(cmd: list[str]) -> dict | list | None:
@@ -257,18 +327,56 @@ async def async_get_json_output(cmd: list[str]) -> dict | list | None:
         >>> await async_get_json_output(["npm", "list", "-g", "--json", "--depth=0"])
         {'dependencies': {'npm': {'version': '10.2.3'}}}
     """
+    result = await _async_exec(cmd, 15, log_errors=True)
+    if result is None:
+        return None
+    returncode, stdout, stderr = result
+    if returncode != 0:
+        verbose_log(f"Command failed: {' '.join(cmd)}\nError: {_decode(stderr)}")
+        return None
     try:
-        output = await async_run_command(cmd)
-        if output:
-            parsed = json.loads(output)
+        # json.loads() accepts bytes, so large outputs (system_profiler -json)
+        # are parsed without first building and stripping a decoded copy
+        if stdout and not stdout.isspace():
+            parsed = json.loads(stdout)
             return parsed  # type: ignore[no-any-return]
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         # Invalid JSON output from command - return None as per function contract
         # This is the expected path for commands that output non-JSON or malformed JSON
         verbose_log(f"JSON parsing failed for command {' '.join(cmd)}: {e}")
     return None
 
 
+async def async_run_many(
+    cmds: list[list[str]],
+    concurrency: int = 8,
+    timeout: int = 15,
+    log_errors: bool = True,
+) -> list[str]:
+    """Execute independent commands concurrently, at most ``concurrency`` at a time.
+
+    Args:
+        cmds: Commands to run; each is a list of command and arguments.
+        concurrency: Maximum number of subprocesses alive at once.
+        timeout: Per-command timeout in seconds.
+        log_errors: Whether to log errors to console.
+
+    Returns:
+        Outputs in the same order as ``cmds`` (empty string for failures).
+
+    Examples:
+        >>> await async_run_many([["uname", "-m"], ["sw_vers", "-productVersion"]])
+        ['arm64', '14.2.1']
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(cmd: list[str]) -> str:
+        async with semaphore:
+            return await async_run_command(cmd, timeout=timeout, log_errors=log_errors)
+
+    return list(await asyncio.gather(*(_bounded(cmd) for cmd in cmds)))
+
+
 def get_json_output(cmd: list[str]) -> dict | list | None:
     """Execute a command and parse its JSON output.
 
@@ -308,12 +416,17 @@ def which(cmd: str) -> str | None:
         >>> which("python3")
         '/usr/bin/python3 -> /Library/Developer/CommandLineTools/usr/bin/python3'
     """
-    path = shutil.which(cmd)
+    return _which_cached(cmd, os.environ.get("PATH", os.defpath))
+
+
+@functools.lru_cache(maxsize=512)
+def _which_cached(cmd: str, path_env: str) -> str | None:
+    """Memoized which(); keyed on PATH so changes to it are still honoured."""
+    path = shutil.which(cmd, path=path_env)
     if not path:
         return None
-    p = Path(path)
-    if p.is_symlink():
-        return f"{path} -> {p.resolve()}"
+    if os.path.islink(path):
+        return f"{path} -> {os.path.realpath(path)}"
     return path
 
 
@@ -332,13 +445,83 @@ def get_version(cmd: list[str]) -> str:
     """
     try:
         # Version checks often fail if tool is not installed, so we suppress error logging
-        out = run(cmd, timeout=3, log_errors=False)
+        out = run(cmd, timeout=3, log_errors=False, cacheable=True)
         out = out.splitlines()[0] if out else ""
         return out.strip() if out.strip() else "Not installed"
     except (OSError, IndexError):
         return "Not installed"
 
 
+async def async_get_versions(checks: dict[str, list[str]], concurrency: int = 8) -> dict[str, str]:
+    """Get version strings for several commands concurrently.
+
+    Async counterpart of calling get_version() for each command; the probes
+    share one async_run_many() fan-out instead of running one after another.
+
+    Args:
+        checks: Mapping of tool name to command with version flag.
+        concurrency: Maximum number of probes running at once.
+
+    Returns:
+        Mapping of tool name to version string or "Not installed".
+
+    Examples:
+        >>> await async_get_versions({"node": ["node", "--version"]})
+        {'node': 'v20.11.0'}
+    """
+    outputs = await async_run_many(
+        list(checks.values()), concurrency=concurrency, timeout=3, log_errors=False
+    )
+    return {
+        name: (out.splitlines()[0].strip() if out else "") or "Not installed"
+        for name, out in zip(checks, outputs)
+    }
+
+
+# Info.plist version keys in order of preference
+_APP_VERSION_KEYS = (
+    "CFBundleShortVersionString",  # Standard user-facing version
+    "CFBundleVersion",  # Build version (fallback)
+    "CFBundleGetInfoString",  # Legacy version info
+)
+
+
+# Info.plist path -> ((st_ino, st_mtime_ns, st_size), version) for parsed bundles
+_plist_versions: dict[str, tuple[tuple[int, int, int], str]] = {}
+
+
+def _read_plist_version(plist_path: Path) -> str | None:
+    """Pick the preferred version key from an Info.plist parsed in-process.
+
+    Results are memoized against the file's inode, mtime and size, so an
+    unchanged bundle costs a single stat on later calls (e.g. TUI refreshes).
+
+    Returns:
+        Version string ("" if no key is set), or None when plistlib cannot read the file.
+    """
+    path_key = str(plist_path)
+    try:
+        st = os.stat(path_key)
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _plist_versions.get(path_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        with open(path_key, "rb") as f:
+            info = plistlib.load(f)
+    except (plistlib.InvalidFileException, ValueError, OSError):
+        return None
+    if not isinstance(info, dict):
+        return None
+    version = ""
+    for key in _APP_VERSION_KEYS:
+        value = info.get(key)
+        if value is not None and str(value).strip():
+            version = str(value).strip()
+            break
+    _plist_versions[path_key] = (stamp, version)
+    return version
+
+
 def get_app_version(app_path: Path) -> str:
     """Extract version from a macOS .app bundle.
 
@@ -362,17 +545,17 @@ def get_app_version(app_path: Path) -> str:
         if not plist_path.exists():
             return ""
 
-        # Try multiple version keys in order of preference
-        version_keys = [
-            "CFBundleShortVersionString",  # Standard user-facing version
-            "CFBundleVersion",  # Build version (fallback)
-            "CFBundleGetInfoString",  # Legacy version info
-        ]
+        # XML and binary plists are parsed directly, without a subprocess
+        version = _read_plist_version(plist_path)
+        if version is not None:
+            return version
 
-        for key in version_keys:
+        # defaults also understands legacy formats plistlib rejects
+        for key in _APP_VERSION_KEYS:
             ver = run(
                 ["defaults", "read", str(plist_path.absolute()), key],
                 log_errors=False,
+                cacheable=True,
             )
             if ver.strip():
                 return ver.strip()
@@ -400,11 +583,30 @@ def safe_glob(path_str: str, pattern: str) -> list[str]:
         path = Path(path_str).expanduser()
         if not path.exists():
             return []
+        if "/" not in pattern and "**" not in pattern:
+            # Single-level patterns ("*.app") only need one directory listing;
+            # match names as strings instead of building a Path per entry
+            match = _compile_glob(pattern)
+            with os.scandir(path) as entries:
+                return [entry.path for entry in entries if match(entry.name)]
         return [str(p) for p in path.glob(pattern)]
     except (PermissionError, OSError):
         return []
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """Compile a single-component glob pattern (case-sensitive, like Path.glob)."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+# EDID bytes 8-17: manufacturer ID (2 bytes), then little-endian product code,
+# serial number, manufacture week and year offset
+_EDID_ID_BLOCK = struct.Struct("<BBHIBB")
+# 5-bit manufacturer letter codes map to ASCII 64..95 ("A" is 1)
+_EDID_MFG_CHARS = b"@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_"
+
+
 def parse_edid(edid_bytes: bytes) -> dict[str, str | None]:
     """Parse EDID (Extended Display Identification Data) to extract display information.
 
@@ -435,38 +637,29 @@ def parse_edid(edid_bytes: bytes) -> dict[str, str | None]:
         "manufacture_year": None,
     }
 
-    try:
-        if len(edid_bytes) < 18:
-            return result
-
-        # Parse manufacturer ID (bytes 8-9)
-        # Format: 5-bit packed ASCII (A=1, B=2, ..., Z=26)
-        mfg_bytes = int.from_bytes(edid_bytes[8:10], "big")
-        char1 = chr(((mfg_bytes >> 10) & 0x1F) + 64)
-        char2 = chr(((mfg_bytes >> 5) & 0x1F) + 64)
-        char3 = chr((mfg_bytes & 0x1F) + 64)
-        result["manufacturer_id"] = f"{char1}{char2}{char3}"
-
-        # Parse product code (bytes 10-11, little-endian)
-        product_code = int.from_bytes(edid_bytes[10:12], "little")
-        result["product_code"] = f"0x{product_code:04x}"
-
-        # Parse serial number (bytes 12-15, little-endian)
-        serial = int.from_bytes(edid_bytes[12:16], "little")
-        if serial != 0:
-            result["serial_number"] = str(serial)
-
-        # Parse manufacture week (byte 16)
-        week = edid_bytes[16]
-        if week != 0xFF and week <= 53:
-            result["manufacture_week"] = str(week)
-
-        # Parse manufacture year (byte 17, offset from 1990)
-        year_offset = edid_bytes[17]
-        if year_offset > 0:
-            result["manufacture_year"] = str(1990 + year_offset)
+    if len(edid_bytes) < 18:
+        return result
 
-    except Exception as e:
-        verbose_log(f"EDID parsing error: {e}")
+    mfg_hi, mfg_lo, product_code, serial, week, year_offset = _EDID_ID_BLOCK.unpack_from(
+        edid_bytes, 8
+    )
+
+    # Manufacturer ID (bytes 8-9, big-endian): three 5-bit letters (A=1, B=2, ..., Z=26)
+    mfg = (mfg_hi << 8) | mfg_lo
+    result["manufacturer_id"] = bytes(
+        (
+            _EDID_MFG_CHARS[(mfg >> 10) & 0x1F],
+            _EDID_MFG_CHARS[(mfg >> 5) & 0x1F],
+            _EDID_MFG_CHARS[mfg & 0x1F],
+        )
+    ).decode("ascii")
+
+    result["product_code"] = f"0x{product_code:04x}"
+    if serial != 0:
+        result["serial_number"] = str(serial)
+    if week != 0xFF and week <= 53:
+        result["manufacture_week"] = str(week)
+    if year_offset > 0:
+        result["manufacture_year"] = str(1990 + year_offset)
 
     return result
@@ -0,0 +1,79 @@
+"""Tests for the per-boot invariant cache."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prose import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the cache at a temp dir and reset the per-process memo."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "_boot_uuid", None)
+    monkeypatch.setattr(cache, "_boot_cache", None)
+    return tmp_path
+
+
+class TestBootCache:
+    """Test suite for boot-keyed cache helpers."""
+
+    @patch("prose.cache.run", return_value="ABC-123\n")
+    def test_boot_session_uuid_memoized(self, mock_run):
+        """Test the boot UUID is read once per process."""
+        assert cache.get_boot_session_uuid() == "ABC-123"
+        assert cache.get_boot_session_uuid() == "ABC-123"
+        mock_run.assert_called_once()
+
+    @patch("prose.cache.run", return_value="")
+    def test_no_boot_uuid_disables_cache(self, mock_run, isolated_cache):
+        """Test nothing is written when the boot UUID is unavailable."""
+        data = cache.load_boot_cache()
+        assert data == {}
+        data["hardware"] = {"cpu": "Apple M1", "cpu_cores": 8, "memory_gb": 16.0}
+        cache.save_boot_cache(data)
+        assert list(isolated_cache.iterdir()) == []
+
+    @patch("prose.cache.run", return_value="BOOT-2")
+    def test_save_and_reload(self, mock_run, isolated_cache, monkeypatch):
+        """Test invariants round-trip and stale boot files are pruned."""
+        (isolated_cache / "BOOT-1.json").write_text("{}")
+        data = cache.load_boot_cache()
+        data["hardware"] = {"cpu": "Apple M1", "cpu_cores": 8, "memory_gb": 16.0}
+        cache.save_boot_cache(data)
+
+        assert [p.name for p in isolated_cache.iterdir()] == ["BOOT-2.json"]
+
+        monkeypatch.setattr(cache, "_boot_cache", None)
+        reloaded = cache.load_boot_cache()
+        assert reloaded["hardware"]["memory_gb"] == 16.0
+
+    @patch("prose.cache.run", return_value="BOOT-3")
+    def test_corrupt_cache_ignored(self, mock_run, isolated_cache):
+        """Test an unreadable cache file falls back to an empty cache."""
+        (isolated_cache / "BOOT-3.json").write_text("{not json")
+        assert cache.load_boot_cache() == {}
+
+    @patch("prose.cache.run", return_value="BOOT-4")
+    def test_incomplete_section_ignored(self, mock_run, isolated_cache):
+        """Test a section missing expected keys is treated as a cache miss."""
+        (isolated_cache / "BOOT-4.json").write_text(
+            json.dumps(
+                {
+                    "hardware": {"cpu": "Apple M1", "cpu_cores": 8, "memory_gb": 16.0},
+                    "system": {"macos_version": "14.2"},
+                }
+            )
+        )
+        data = cache.load_boot_cache()
+        assert "system" not in data
+        assert data["hardware"]["cpu_cores"] == 8
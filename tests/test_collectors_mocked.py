@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -105,6 +105,23 @@ class TestPackagesCollectorMocked:
         assert info["npm"]["version"] == "10.2.4"
 
 
+class TestSystemInvariantsMocked:
+    @patch("prose.collectors.system.async_run_command", new_callable=AsyncMock)
+    def test_sip_probe_failure_is_unknown(self, mock_async_run):
+        import asyncio
+
+        from prose.collectors.system import _check_sip_enabled
+
+        mock_async_run.return_value = ""
+        assert asyncio.run(_check_sip_enabled()) is None
+
+        mock_async_run.return_value = "System Integrity Protection status: disabled."
+        assert asyncio.run(_check_sip_enabled()) is False
+
+        mock_async_run.return_value = "System Integrity Protection status: enabled."
+        assert asyncio.run(_check_sip_enabled()) is True
+
+
 class TestDeveloperCollectorMocked:
     @patch("prose.collectors.developer.run")
     @patch("prose.collectors.developer.which")
@@ -121,6 +138,22 @@ class TestDeveloperCollectorMocked:
         assert "languages" in info
         assert "docker" in info
 
+    @patch("prose.utils.async_run_command")
+    @patch("prose.collectors.developer.which")
+    def test_collect_languages_probes_installed_only(self, mock_which, mock_async_run):
+        import asyncio
+
+        from prose.collectors.developer import collect_languages
+
+        mock_which.side_effect = lambda cmd: f"/usr/bin/{cmd}" if cmd in ("node", "rustc") else None
+        mock_async_run.return_value = "v20.11.0\nextra"
+
+        languages = asyncio.run(collect_languages())
+        assert languages["node"] == "v20.11.0"
+        assert languages["rust"] == "v20.11.0"
+        assert languages["python3"] == "Not installed"
+        assert mock_async_run.call_count == 2
+
 
 class TestEnvironmentCollectorMocked:
     @patch("prose.collectors.environment.run")
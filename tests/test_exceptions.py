@@ -40,6 +40,17 @@ class TestExceptions:
         assert "Command not found" in str(error)
         assert error.command == cmd
 
+    def test_lazy_message_formatting(self):
+        """Test messages are formatted on demand and errors still pickle."""
+        import pickle
+
+        error = SystemCommandError(["sw_vers", "-productVersion"], "boom")
+        assert error.args == (["sw_vers", "-productVersion"], "boom")
+        assert str(error) == "Command failed: sw_vers -productVersion\nboom"
+
+        restored = pickle.loads(pickle.dumps(CollectorError("system", "failed")))
+        assert str(restored) == "[system] failed"
+
     def test_unsupported_platform_error(self):
         """Test UnsupportedPlatformError with platform name."""
         error = UnsupportedPlatformError("linux")
@@ -0,0 +1,111 @@
+"""Tests for NVRAM access helpers."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prose import iokit
+
+
+NVRAM_DUMP = (
+    "boot-args\tamfi=0x80 -v\n"
+    "csr-active-config\t%03%08%00%00\n"
+    "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102:OCLP-Version\t2.4.1%00\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_nvram_cache():
+    """Drop the cached NVRAM dump between tests."""
+    iokit.invalidate_nvram_cache()
+    yield
+    iokit.invalidate_nvram_cache()
+
+
+class TestNVRAM:
+    """Test suite for NVRAM reads."""
+
+    @patch("prose.iokit.run", return_value=NVRAM_DUMP)
+    def test_read_nvram_all(self, mock_run):
+        """Test nvram -p output is parsed into a dict."""
+        nvram = iokit.read_nvram_all()
+        assert nvram["boot-args"] == "amfi=0x80 -v"
+        assert len(nvram) == 3
+
+    @patch("prose.iokit.run", return_value=NVRAM_DUMP)
+    def test_getters_share_one_dump(self, mock_run):
+        """Test all getters are served from a single nvram invocation."""
+        assert iokit.get_boot_args() == "amfi=0x80 -v"
+        assert iokit.get_csr_active_config() == "%03%08%00%00"
+        assert iokit.get_oclp_nvram_version() == "2.4.1%00"
+        assert iokit.get_secure_boot_model() is None
+        mock_run.assert_called_once()
+
+    @patch("prose.iokit.run", return_value=NVRAM_DUMP)
+    def test_invalidate_nvram_cache(self, mock_run):
+        """Test invalidation forces a fresh nvram read."""
+        iokit.read_nvram_all()
+        iokit.invalidate_nvram_cache()
+        iokit.read_nvram_all()
+        assert mock_run.call_count == 2
+
+    def test_format_nvram_data(self):
+        """Test NVRAM data bytes render like nvram -p output."""
+        assert iokit._format_nvram_data(b"2.4.1\x00") == "2.4.1%00"
+        assert iokit._format_nvram_data(b"\x03\x08%") == "%03%08%25"
+        assert iokit._format_nvram_number(7) == "7"
+        assert iokit._format_nvram_number(4096) == "0x1000"
+
+    @patch("prose.iokit._read_nvram_iokit", return_value={"boot-args": "-v"})
+    @patch("prose.iokit.run")
+    def test_iokit_path_skips_subprocess(self, mock_run, mock_iokit):
+        """Test the IORegistry reader is preferred over the nvram command."""
+        assert iokit.get_boot_args() == "-v"
+        mock_run.assert_not_called()
+
+    @patch("prose.iokit.run", return_value="")
+    def test_read_nvram_missing(self, mock_run):
+        """Test missing NVRAM returns None."""
+        assert iokit.read_nvram("boot-args") is None
+
+
+class TestAMFI:
+    """Test suite for AMFI boot-arg parsing."""
+
+    def test_parse_amfi_hex(self):
+        """Test hex AMFI value sets the matching flags."""
+        result = iokit.parse_amfi_boot_arg("-v amfi=0x3 debug=0x100")
+        assert result["amfi_value"] == "0x3"
+        assert result["allow_task_for_pid"] is True
+        assert result["allow_invalid_signature"] is True
+        assert result["lv_enforce_third_party"] is False
+
+    def test_parse_amfi_decimal(self):
+        """Test decimal AMFI value."""
+        result = iokit.parse_amfi_boot_arg("amfi=4")
+        assert result["lv_enforce_third_party"] is True
+
+    def test_parse_amfi_leading_zero_decimal(self):
+        """Test a zero-padded decimal value is still parsed."""
+        result = iokit.parse_amfi_boot_arg("amfi=003")
+        assert result["amfi_value"] == "003"
+        assert result["allow_task_for_pid"] is True
+        assert result["allow_invalid_signature"] is True
+
+    def test_parse_amfi_invalid(self):
+        """Test an unparsable AMFI value is reported without flags."""
+        result = iokit.parse_amfi_boot_arg("amfi=bogus")
+        assert result["amfi_value"] == "bogus"
+        assert result["allow_invalid_signature"] is False
+
+    def test_parse_amfi_absent(self):
+        """Test boot-args without amfi leave the defaults."""
+        assert iokit.parse_amfi_boot_arg("-v debug=0x100")["amfi_value"] is None
+        assert iokit.parse_amfi_boot_arg(None)["amfi_value"] is None
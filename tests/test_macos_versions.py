@@ -0,0 +1,106 @@
+"""Tests for macOS version detection helpers."""
+
+from __future__ import annotations
+
+import io
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prose import macos_versions
+
+
+@pytest.fixture(autouse=True)
+def clear_version_caches():
+    """Drop the per-process sw_vers and version-info memos between tests."""
+    caches = (
+        macos_versions._sw_vers_all,
+        macos_versions.get_version_name_from_system,
+        macos_versions.get_macos_version_info,
+    )
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+class TestParseVersionString:
+    """Test suite for version string parsing."""
+
+    def test_full_and_short_versions(self):
+        """Test major.minor.patch and major.minor strings."""
+        assert macos_versions.parse_version_string("12.7.6") == (12, 7, 6)
+        assert macos_versions.parse_version_string("14.2") == (14, 2, 0)
+
+    def test_empty_and_malformed(self):
+        """Test empty or non-numeric input yields zeros instead of raising."""
+        assert macos_versions.parse_version_string("") == (0, 0, 0)
+        assert macos_versions.parse_version_string("unknown") == (0, 0, 0)
+        assert macos_versions.parse_version_string("15.0b3") == (15, 0, 0)
+
+
+class TestVersionNames:
+    """Test suite for version number to name mapping."""
+
+    def test_name_from_number(self):
+        """Test 11+ releases map by major and 10.x by minor."""
+        assert macos_versions.get_version_name_from_number("12.7.6") == "Monterey"
+        assert macos_versions.get_version_name_from_number("10.15.7") == "Catalina"
+
+    def test_name_from_empty_number(self):
+        """Test an empty version falls back to the generic name."""
+        assert macos_versions.get_version_name_from_number("") == "macOS"
+
+    @patch("prose.macos_versions.open", side_effect=OSError, create=True)
+    @patch("prose.macos_versions.run", return_value="")
+    def test_version_info_without_sw_vers(self, mock_run, mock_open):
+        """Test get_macos_version_info() survives empty sw_vers output."""
+        info = macos_versions.get_macos_version_info()
+        assert info["version"] == ""
+        assert (info["major"], info["minor"], info["patch"]) == (0, 0, 0)
+        assert info["name"] == "macOS"
+        assert info["marketing_name"] == "macOS"
+
+    @patch("prose.macos_versions.open", side_effect=OSError, create=True)
+    @patch("prose.macos_versions.run", return_value="ProductVersion:\tunknown\n")
+    def test_version_info_malformed_sw_vers(self, mock_run, mock_open):
+        """Test a non-numeric ProductVersion does not raise."""
+        info = macos_versions.get_macos_version_info()
+        assert info["version"] == "unknown"
+        assert info["major"] == 0
+        assert info["name"] == "macOS"
+
+
+def _license_only_open(text: str):
+    """Return an open() stand-in that only serves the Setup Assistant license."""
+
+    def fake_open(path, mode="r", *args, **kwargs):
+        if "Setup Assistant" in str(path):
+            return io.BytesIO(text.encode())
+        raise OSError(path)
+
+    return fake_open
+
+
+class TestVersionNameFromLicense:
+    """Test suite for the license-file name fallback."""
+
+    @patch("prose.macos_versions.run", return_value="")
+    def test_known_name_in_license(self, mock_run):
+        """Test a known release name is picked out of the license text."""
+        text = "macOS Software License Agreement for macOS Sonoma"
+        with patch("prose.macos_versions.open", _license_only_open(text), create=True):
+            assert macos_versions.get_version_name_from_system() == "Sonoma"
+
+    @patch("prose.macos_versions.run", return_value="")
+    def test_unknown_phrase_not_used(self, mock_run):
+        """Test capitalized license phrases are never reported as a name."""
+        text = "macOS Software License Agreement"
+        with patch("prose.macos_versions.open", _license_only_open(text), create=True):
+            assert macos_versions.get_version_name_from_system() == "macOS"
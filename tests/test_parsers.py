@@ -0,0 +1,50 @@
+"""Tests for command output parsers."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prose.parsers import parse_key_value_block
+
+
+class TestParseKeyValueBlock:
+    """Test suite for parse_key_value_block()."""
+
+    def test_sw_vers_output(self):
+        """Test colon separators followed by tabs (sw_vers layout)."""
+        output = "ProductName:\t\tmacOS\nProductVersion:\t\t14.2.1\nBuildVersion:\t\t23C71\n"
+        assert parse_key_value_block(output) == {
+            "ProductName": "macOS",
+            "ProductVersion": "14.2.1",
+            "BuildVersion": "23C71",
+        }
+
+    def test_tab_separator(self):
+        """Test a tab separator (nvram -p layout)."""
+        output = "boot-args\t-v amfi=0x80\ncsr-active-config\t%03%08%00%00"
+        assert parse_key_value_block(output, separator="\t") == {
+            "boot-args": "-v amfi=0x80",
+            "csr-active-config": "%03%08%00%00",
+        }
+
+    def test_blank_and_separatorless_lines_skipped(self):
+        """Test blank lines and lines without the separator are ignored."""
+        output = "\nName: prose\n\n   \nno separator here\nKind: tool\n"
+        assert parse_key_value_block(output) == {"Name": "prose", "Kind": "tool"}
+
+    def test_value_containing_separator(self):
+        """Test only the first separator splits key from value."""
+        output = "Boot time: 10:30:15\nURL: https://example.com:8080/"
+        assert parse_key_value_block(output) == {
+            "Boot time": "10:30:15",
+            "URL": "https://example.com:8080/",
+        }
+
+    def test_duplicates_and_empty_input(self):
+        """Test later duplicates win and empty input yields an empty dict."""
+        assert parse_key_value_block("A: 1\nA: 2") == {"A": "2"}
+        assert parse_key_value_block("") == {}
@@ -0,0 +1,55 @@
+"""Tests for in-process sysctl helpers."""
+
+from __future__ import annotations
+
+import struct
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prose import sysctl
+
+
+class TestSysctl:
+    """Test suite for sysctl value decoding."""
+
+    @patch("prose.sysctl.sysctlbyname", return_value=(16 * 1024**3).to_bytes(8, sys.byteorder))
+    def test_sysctl_int_64bit(self, mock_sysctl):
+        """Test 64-bit integer decoding (hw.memsize)."""
+        assert sysctl.sysctl_int("hw.memsize") == 16 * 1024**3
+
+    @patch("prose.sysctl.sysctlbyname", return_value=(8).to_bytes(4, sys.byteorder))
+    def test_sysctl_int_32bit(self, mock_sysctl):
+        """Test 32-bit integer decoding (hw.ncpu)."""
+        assert sysctl.sysctl_int("hw.ncpu") == 8
+
+    @patch("prose.sysctl.sysctlbyname", return_value=b"abc")
+    def test_sysctl_int_bad_size(self, mock_sysctl):
+        """Test unexpected value sizes are rejected."""
+        assert sysctl.sysctl_int("hw.bogus") is None
+
+    @patch("prose.sysctl.sysctlbyname", return_value=b"Apple M1\x00")
+    def test_sysctl_string(self, mock_sysctl):
+        """Test NUL-terminated string decoding."""
+        assert sysctl.sysctl_string("machdep.cpu.brand_string") == "Apple M1"
+
+    @patch("prose.sysctl.sysctlbyname", return_value=struct.pack("@li", 1770357120, 528688))
+    def test_get_boot_time(self, mock_sysctl):
+        """Test struct timeval decoding (kern.boottime)."""
+        assert sysctl.get_boot_time() == (1770357120, 528688)
+
+    @patch("prose.sysctl.sysctlbyname", return_value=struct.pack("@3Il", 2048, 1024, 512, 2048))
+    def test_get_load_average(self, mock_sysctl):
+        """Test struct loadavg decoding (vm.loadavg)."""
+        assert sysctl.get_load_average() == (1.0, 0.5, 0.25)
+
+    @patch("prose.sysctl.sysctlbyname", return_value=None)
+    def test_unavailable_returns_none(self, mock_sysctl):
+        """Test helpers report None so callers can fall back to the command."""
+        assert sysctl.sysctl_int("hw.ncpu") is None
+        assert sysctl.sysctl_string("machdep.cpu.brand_string") is None
+        assert sysctl.get_boot_time() is None
+        assert sysctl.get_load_average() is None
@@ -0,0 +1,93 @@
+"""Tests for the enhanced TUI refreshing in place from a new report."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("textual")
+
+from textual.widgets import DataTable
+
+from prose.tui.app_enhanced import PackagesTable, ProcessesTable, SystemProseAppEnhanced
+
+
+def _report(processes: list[dict], formulae: list[str] | None = None) -> dict:
+    """Build a minimal report with the given top processes and brew formulae."""
+    return {
+        "top_processes": processes,
+        "package_managers": {"homebrew": {"installed": True, "formula": formulae or []}},
+    }
+
+
+def _proc(pid: int, cpu: float, command: str = "proc") -> dict:
+    return {"pid": pid, "cpu_percent": cpu, "memory": "1 MB", "command": command}
+
+
+def _table_rows(table: DataTable) -> list[list[str]]:
+    return [[str(cell) for cell in table.get_row_at(i)] for i in range(table.row_count)]
+
+
+class TestSetReport:
+    """set_report() updates live tables and rebuilds stale panes."""
+
+    def test_processes_table_tracks_pids(self):
+        before = _report([_proc(1, 50.0, "kept"), _proc(2, 10.0, "exited")])
+        after = _report([_proc(1, 5.0, "kept"), _proc(3, 20.0, "started")])
+
+        async def run() -> list[list[str]]:
+            app = SystemProseAppEnhanced(before)
+            async with app.run_test(size=(160, 60)) as pilot:
+                app.set_report(after)
+                await pilot.pause()
+                table = app.query_one(ProcessesTable).query_one(DataTable)
+                return _table_rows(table)
+
+        assert asyncio.run(run()) == [
+            ["started", "3", "20.0", "1 MB"],
+            ["kept", "1", "5.0", "1 MB"],
+        ]
+
+    def test_opened_pane_is_rebuilt(self):
+        before = _report([], ["git"])
+        after = _report([], ["git", "wget"])
+
+        async def run() -> tuple[int, int]:
+            app = SystemProseAppEnhanced(before)
+            async with app.run_test(size=(160, 60)) as pilot:
+                await pilot.press("5")
+                await pilot.pause()
+                stale = app.query_one(PackagesTable).query_one(DataTable).row_count
+                app.set_report(after)
+                await pilot.pause()
+                fresh = app.query_one(PackagesTable).query_one(DataTable).row_count
+                return stale, fresh
+
+        assert asyncio.run(run()) == (1, 2)
+
+    def test_inactive_pane_is_rebuilt_on_activation(self):
+        before = _report([], ["git"])
+        after = _report([], ["git", "wget", "jq"])
+
+        async def run() -> int:
+            app = SystemProseAppEnhanced(before)
+            async with app.run_test(size=(160, 60)) as pilot:
+                await pilot.press("5")
+                await pilot.pause()
+                await pilot.press("1")
+                await pilot.pause()
+                app.set_report(after)
+                await pilot.pause()
+                await pilot.press("5")
+                await pilot.pause()
+                tables = app.query(PackagesTable)
+                assert len(tables) == 1
+                return tables.first().query_one(DataTable).row_count
+
+        assert asyncio.run(run()) == 3
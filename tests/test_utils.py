@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
+import plistlib
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from prose import utils
 
 
+@pytest.fixture(autouse=True)
+def clear_run_cache():
+    """Drop memoized command output and which() lookups between tests."""
+    utils.invalidate_run_cache()
+    yield
+    utils.invalidate_run_cache()
+
+
+def _make_app(tmp_path: Path, info: dict, fmt: plistlib.PlistFormat = plistlib.FMT_XML) -> Path:
+    """Create a minimal .app bundle with the given Info.plist contents."""
+    app = tmp_path / "Test.app"
+    (app / "Contents").mkdir(parents=True)
+    with (app / "Contents/Info.plist").open("wb") as f:
+        plistlib.dump(info, f, fmt=fmt)
+    return app
+
+
 class TestUtilityFunctions:
     """Test suite for utility functions."""
 
@@ -26,6 +47,25 @@ class TestUtilityFunctions:
         result = utils.which("nonexistent_command_12345")
         assert result is None
 
+    def test_which_memoized(self):
+        """Test which() looks a command up once per PATH value."""
+        with patch("prose.utils.shutil.which", return_value=None) as mock_which:
+            assert utils.which("memo_cmd_12345") is None
+            assert utils.which("memo_cmd_12345") is None
+            mock_which.assert_called_once()
+            with patch.dict("os.environ", {"PATH": "/nonexistent_path_xyz"}):
+                utils.which("memo_cmd_12345")
+            assert mock_which.call_count == 2
+
+    def test_which_invalidated(self):
+        """Test invalidate_run_cache() makes which() look commands up again."""
+        with patch("prose.utils.shutil.which", return_value=None) as mock_which:
+            assert utils.which("memo_cmd_12345") is None
+            utils.invalidate_run_cache()
+            mock_which.return_value = "/usr/local/bin/memo_cmd_12345"
+            assert utils.which("memo_cmd_12345") == "/usr/local/bin/memo_cmd_12345"
+            assert mock_which.call_count == 2
+
     def test_get_version_success(self):
         """Test get_version() with working command."""
         version = utils.get_version(["python3", "--version"])
@@ -92,6 +132,21 @@ class TestUtilityFunctions:
         result = utils.safe_glob("/nonexistent_path_xyz", "*.app")
         assert result == []
 
+    def test_safe_glob_single_level(self, tmp_path):
+        """Test safe_glob() single-level patterns match like Path.glob."""
+        for name in ("A.app", "B.app", ".Hidden.app", "notes.txt", "C.APP"):
+            (tmp_path / name).mkdir()
+        result = utils.safe_glob(str(tmp_path), "*.app")
+        assert sorted(result) == sorted(str(p) for p in tmp_path.glob("*.app"))
+        assert str(tmp_path / "C.APP") not in result
+
+    def test_safe_glob_recursive(self, tmp_path):
+        """Test safe_glob() recursive patterns."""
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "pkg" / "sub" / "mod.py").write_text("")
+        result = utils.safe_glob(str(tmp_path), "**/*.py")
+        assert result == [str(tmp_path / "pkg" / "sub" / "mod.py")]
+
     def test_log_levels(self, capsys):
         """Test log() with different levels."""
         utils.QUIET = False
@@ -126,48 +181,93 @@ class TestUtilityFunctions:
         result = utils.run(["sleep", "10"], timeout=1)
         assert result == ""
 
+    def test_run_capture_stderr(self):
+        """Test run() returns stderr when capture_stderr is set, even on failure."""
+        result = utils.run(["sh", "-c", "echo out; echo err >&2; exit 1"], capture_stderr=True)
+        assert result == "err"
+
     def test_run_command_failure(self):
         """Test run() with failing command."""
         result = utils.run(["false"])
         assert result == ""
 
-    @patch("prose.utils.run")
-    def test_get_app_version_short_version(self, mock_run):
+    @patch("prose.utils.subprocess.run")
+    def test_run_cacheable_spawns_once(self, mock_subprocess):
+        """Test cacheable commands are executed once per process."""
+        mock_subprocess.return_value.returncode = 0
+        mock_subprocess.return_value.stdout = b"1.0\n"
+        assert utils.run(["tool", "--version"], cacheable=True) == "1.0"
+        assert utils.run(["tool", "--version"], cacheable=True) == "1.0"
+        mock_subprocess.assert_called_once()
+
+        utils.run(["tool", "--version"])
+        assert mock_subprocess.call_count == 2
+
+        utils.invalidate_run_cache()
+        utils.run(["tool", "--version"], cacheable=True)
+        assert mock_subprocess.call_count == 3
+
+    @patch("prose.utils.subprocess.run")
+    def test_run_cacheable_failure_not_cached(self, mock_subprocess):
+        """Test failed or timed-out cacheable commands are retried on the next call."""
+        mock_subprocess.side_effect = subprocess.TimeoutExpired(["tool"], 3)
+        assert utils.run(["tool", "--version"], cacheable=True) == ""
+
+        mock_subprocess.side_effect = None
+        mock_subprocess.return_value.returncode = 0
+        mock_subprocess.return_value.stdout = b"1.0\n"
+        assert utils.run(["tool", "--version"], cacheable=True) == "1.0"
+        assert mock_subprocess.call_count == 2
+
+    def test_get_app_version_short_version(self, tmp_path):
         """Test get_app_version() with CFBundleShortVersionString."""
-        mock_run.return_value = "1.2.3"
-        fake_app = Path("/Applications/Test.app")
-        with patch.object(Path, "exists", return_value=True):
-            version = utils.get_app_version(fake_app)
-            assert version == "1.2.3"
+        app = _make_app(tmp_path, {"CFBundleShortVersionString": "1.2.3", "CFBundleVersion": "42"})
+        with patch("prose.utils.run") as mock_run:
+            assert utils.get_app_version(app) == "1.2.3"
+            mock_run.assert_not_called()
 
-    @patch("prose.utils.run")
-    def test_get_app_version_fallback_keys(self, mock_run):
+    def test_get_app_version_fallback_keys(self, tmp_path):
         """Test get_app_version() falls back to CFBundleVersion and CFBundleGetInfoString."""
-        # Simulate CFBundleShortVersionString missing, CFBundleVersion found
-        mock_run.side_effect = ["", "1.0.0", ""]
-        fake_app = Path("/Applications/Test.app")
-        with patch.object(Path, "exists", return_value=True):
-            version = utils.get_app_version(fake_app)
-            assert version == "1.0.0"
+        app = _make_app(tmp_path, {"CFBundleShortVersionString": "", "CFBundleVersion": "1.0.0"})
+        assert utils.get_app_version(app) == "1.0.0"
 
-    @patch("prose.utils.run")
-    def test_get_app_version_legacy_key(self, mock_run):
+    def test_get_app_version_legacy_key(self, tmp_path):
         """Test get_app_version() uses CFBundleGetInfoString as last resort."""
-        # Simulate only CFBundleGetInfoString available
-        mock_run.side_effect = ["", "", "20250001"]
-        fake_app = Path("/Applications/Test.app")
-        with patch.object(Path, "exists", return_value=True):
-            version = utils.get_app_version(fake_app)
-            assert version == "20250001"
+        app = _make_app(tmp_path, {"CFBundleGetInfoString": "20250001"})
+        assert utils.get_app_version(app) == "20250001"
 
-    @patch("prose.utils.run")
-    def test_get_app_version_no_version(self, mock_run):
+    def test_get_app_version_binary_plist(self, tmp_path):
+        """Test get_app_version() reads binary Info.plist files."""
+        app = _make_app(tmp_path, {"CFBundleVersion": "7"}, fmt=plistlib.FMT_BINARY)
+        assert utils.get_app_version(app) == "7"
+
+    def test_get_app_version_no_version(self, tmp_path):
         """Test get_app_version() returns empty string when no version found."""
-        mock_run.return_value = ""
-        fake_app = Path("/Applications/Test.app")
-        with patch.object(Path, "exists", return_value=True):
-            version = utils.get_app_version(fake_app)
-            assert version == ""
+        app = _make_app(tmp_path, {"CFBundleName": "Test"})
+        assert utils.get_app_version(app) == ""
+
+    def test_get_app_version_memoized_by_stat(self, tmp_path):
+        """Test an unchanged Info.plist is not parsed again."""
+        app = _make_app(tmp_path, {"CFBundleShortVersionString": "1.0"})
+        assert utils.get_app_version(app) == "1.0"
+        with patch("prose.utils.plistlib.load") as mock_load:
+            assert utils.get_app_version(app) == "1.0"
+            mock_load.assert_not_called()
+
+        with (app / "Contents/Info.plist").open("wb") as f:
+            plistlib.dump({"CFBundleShortVersionString": "2.0.1"}, f)
+        assert utils.get_app_version(app) == "2.0.1"
+
+    @patch("prose.utils.run")
+    def test_get_app_version_defaults_fallback(self, mock_run, tmp_path):
+        """Test get_app_version() reads keys with defaults when plistlib fails."""
+        app = tmp_path / "Test.app"
+        (app / "Contents").mkdir(parents=True)
+        (app / "Contents/Info.plist").write_text('{ CFBundleVersion = "1.0.0"; }')
+        # CFBundleShortVersionString missing, CFBundleVersion found
+        mock_run.side_effect = ["", "1.0.0"]
+        assert utils.get_app_version(app) == "1.0.0"
+        assert mock_run.call_count == 2
 
     def test_get_app_version_no_plist(self):
         """Test get_app_version() with missing Info.plist."""
@@ -204,6 +304,22 @@ class TestAsyncUtilityFunctions:
         result = await utils.async_get_json_output(["echo", "not json"])
         assert result is None
 
+    async def async_test_async_run_many_order(self):
+        """Test async_run_many() returns outputs in command order."""
+        cmds = [["echo", str(i)] for i in range(5)] + [["false"]]
+        result = await utils.async_run_many(cmds, concurrency=2)
+        assert result == ["0", "1", "2", "3", "4", ""]
+
+    async def async_test_async_get_versions(self):
+        """Test async_get_versions() keeps first lines and marks failures."""
+        result = await utils.async_get_versions(
+            {
+                "echo": ["printf", "tool 1.0\\nextra"],
+                "missing": ["nonexistent_cmd_xyz", "--version"],
+            }
+        )
+        assert result == {"echo": "tool 1.0", "missing": "Not installed"}
+
     def test_async_run_command_success(self):
         """Wrapper to run async test."""
         import asyncio
@@ -233,3 +349,15 @@ class TestAsyncUtilityFunctions:
         import asyncio
 
         asyncio.run(self.async_test_async_get_json_output_invalid())
+
+    def test_async_run_many_order(self):
+        """Wrapper to run async test."""
+        import asyncio
+
+        asyncio.run(self.async_test_async_run_many_order())
+
+    def test_async_get_versions(self):
+        """Wrapper to run async test."""
+        import asyncio
+
+        asyncio.run(self.async_test_async_get_versions())